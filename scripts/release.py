@@ -10,14 +10,17 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 MAIN_FILE = PROJECT_ROOT / "src" / "main.py"
 
+_VERSION_RE = re.compile(r'__version__\s*=\s*"([^"]+)"')
+_VERSION_SUB_RE = re.compile(r'__version__\s*=\s*"[^"]+"')
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
 def run_command(command, cwd=None, exit_on_error=True):
-    """Run a shell command."""
-    print(f"Running: {command}")
+    """Run a command given as an argument list (no intermediate shell)."""
+    print(f"Running: {' '.join(command)}")
     try:
         result = subprocess.run(
             command,
             cwd=cwd or PROJECT_ROOT,
-            shell=True,
             check=True,
             capture_output=True,
             text=True
@@ -26,29 +29,23 @@ def run_command(command, cwd=None, exit_on_error=True):
             print(result.stdout)
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        print(f"Error executing command: {command}")
+        print(f"Error executing command: {' '.join(command)}")
         print(e.stderr)
         if exit_on_error:
             sys.exit(1)
         raise e
 
-def get_current_version():
-    """Extract version from main.py."""
-    content = MAIN_FILE.read_text(encoding="utf-8")
-    match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
+def get_current_version(content):
+    """Extract version from main.py content."""
+    match = _VERSION_RE.search(content)
     if match:
         return match.group(1)
     print(f"Error: Could not find __version__ in {MAIN_FILE}")
     sys.exit(1)
 
-def update_version(new_version):
-    """Update version in main.py."""
-    content = MAIN_FILE.read_text(encoding="utf-8")
-    new_content = re.sub(
-        r'__version__\s*=\s*"[^"]+"',
-        f'__version__ = "{new_version}"',
-        content
-    )
+def update_version(content, new_version):
+    """Update version in main.py, reusing the already-read content."""
+    new_content = _VERSION_SUB_RE.sub(f'__version__ = "{new_version}"', content)
     MAIN_FILE.write_text(new_content, encoding="utf-8")
     print(f"Updated {MAIN_FILE} to version {new_version}")
 
@@ -66,11 +63,34 @@ def bump_version(current_version, part="patch"):
         patch += 1
     return f"{major}.{minor}.{patch}"
 
+def tag_exists(tag):
+    """Check for a local tag by reading the refs store directly."""
+    git_dir = PROJECT_ROOT / ".git"
+    if not git_dir.is_dir():
+        # Worktrees/submodules use a .git file; let git resolve it
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"refs/tags/{tag}"],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return result.returncode == 0
+    
+    if (git_dir / "refs" / "tags" / tag).exists():
+        return True
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.exists():
+        ref = f" refs/tags/{tag}"
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            if line.endswith(ref):
+                return True
+    return False
+
 def git_sync():
     """Sync with remote (Pull then Push)."""
     print("\n--- Syncing with Remote ---")
-    run_command("git pull origin HEAD")
-    run_command("git push origin HEAD")
+    run_command(["git", "pull", "origin", "HEAD"])
+    run_command(["git", "push", "origin", "HEAD"])
     print("Sync complete.")
 
 def main():
@@ -86,7 +106,8 @@ def main():
         git_sync()
 
     # 1. Get current version
-    current_version = get_current_version()
+    content = MAIN_FILE.read_text(encoding="utf-8")
+    current_version = get_current_version(content)
     print(f"\nCurrent Version: {current_version}")
     
     # 2. Determine new version
@@ -109,7 +130,7 @@ def main():
         new_version = next_major
     else:
         new_version = input("Enter custom version: ").strip()
-        if not re.match(r"^\d+\.\d+\.\d+$", new_version):
+        if not _SEMVER_RE.match(new_version):
             print("Invalid version format (X.Y.Z)")
             sys.exit(1)
             
@@ -119,33 +140,23 @@ def main():
         sys.exit(0)
 
     # 3. Update File
-    update_version(new_version)
+    update_version(content, new_version)
     
     # 4. Commit and Tag
-    run_command(f'git add "{MAIN_FILE}"')
-    run_command(f'git commit -m "Bump version to v{new_version}"')
+    run_command(["git", "add", str(MAIN_FILE)])
+    run_command(["git", "commit", "-m", f"Bump version to v{new_version}"])
     
     # Check if tag exists (should not happened if we synced but safer)
-    try:
-        # Check silently
-        subprocess.run(
-            f"git rev-parse v{new_version}", 
-            shell=True, 
-            check=True, 
-            stdout=subprocess.DEVNULL, 
-            stderr=subprocess.DEVNULL
-        )
+    if tag_exists(f"v{new_version}"):
         print(f"Warning: Tag v{new_version} already exists locally.")
-    except:
-        pass # Good, tag doesn't exist
         
-    run_command(f"git tag v{new_version}")
+    run_command(["git", "tag", f"v{new_version}"])
     
     # 5. Push
     print("\n--- Pushing to Remote ---")
     if input(f"Push commit and tag v{new_version}? (Y/n): ").lower() != 'n':
-        run_command("git push origin HEAD")
-        run_command(f"git push origin v{new_version}")
+        run_command(["git", "push", "origin", "HEAD"])
+        run_command(["git", "push", "origin", f"v{new_version}"])
         print("\nRelease Pushed! GitHub Actions should start building now.")
     else:
         print("\nChanges committed locally but not pushed.")
@@ -6,7 +6,7 @@ This module handles loading, saving, and managing application configuration.
 
 import logging
 from pathlib import Path
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QSettings, QTimer
 
 logger = logging.getLogger(__name__)
 
@@ -17,60 +17,93 @@ class ConfigManager:
     def __init__(self):
         """Initialize configuration manager"""
         self.settings = QSettings("ADB Manager", "ADB Manager")
+        self._cache: dict[str, object] = {}
+        self._dirty: set[str] = set()
+        
+        # Coalesce bursts of writes (e.g. geometry on resize) into one flush
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(2000)
+        self._flush_timer.timeout.connect(self.flush)
         logger.info("Config Manager initialized")
     
+    def _get(self, key: str, default):
+        """Read a setting, hitting the QSettings backend only on first access"""
+        if key not in self._cache:
+            self._cache[key] = self.settings.value(key, default)
+        return self._cache[key]
+    
+    def _set(self, key: str, value):
+        """Stage a setting in memory; the backend write is deferred to flush()"""
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write all pending settings to the backend and sync"""
+        self._flush_timer.stop()
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            self.settings.setValue(key, self._cache[key])
+        self.settings.sync()
+        self._dirty.clear()
+    
     def save_window_geometry(self, geometry: bytes):
         """Save main window geometry"""
-        self.settings.setValue("window/geometry", geometry)
+        self._set("window/geometry", geometry)
     
     def load_window_geometry(self) -> bytes:
         """Load main window geometry"""
-        return self.settings.value("window/geometry", b"")
+        return self._get("window/geometry", b"")
     
     def save_window_state(self, state: bytes):
         """Save main window state"""
-        self.settings.setValue("window/state", state)
+        self._set("window/state", state)
     
     def load_window_state(self) -> bytes:
         """Load main window state"""
-        return self.settings.value("window/state", b"")
+        return self._get("window/state", b"")
     
     def save_last_device(self, serial: str):
         """Save last connected device"""
-        self.settings.setValue("device/last_serial", serial)
+        self._set("device/last_serial", serial)
     
     def load_last_device(self) -> str:
         """Load last connected device"""
-        return self.settings.value("device/last_serial", "")
+        return self._get("device/last_serial", "")
     
     def save_theme(self, theme: str):
         """Save theme preference (light/dark)"""
-        self.settings.setValue("appearance/theme", theme)
+        self._set("appearance/theme", theme)
     
     def load_theme(self) -> str:
         """Load theme preference"""
-        return self.settings.value("appearance/theme", "light")
+        return self._get("appearance/theme", "light")
     
     def save_adb_path(self, path: str):
         """Save custom ADB binary path"""
-        self.settings.setValue("adb/custom_path", path)
+        self._set("adb/custom_path", path)
     
     def load_adb_path(self) -> str:
         """Load custom ADB binary path"""
-        return self.settings.value("adb/custom_path", "")
+        return self._get("adb/custom_path", "")
     
     def save_last_local_path(self, path: str):
         """Save last used local directory"""
-        self.settings.setValue("files/last_local_path", path)
+        self._set("files/last_local_path", path)
     
     def load_last_local_path(self) -> str:
         """Load last used local directory"""
-        return self.settings.value("files/last_local_path", str(Path.home()))
+        return self._get("files/last_local_path", str(Path.home()))
     
     def save_last_remote_path(self, path: str):
         """Save last used remote directory"""
-        self.settings.setValue("files/last_remote_path", path)
+        self._set("files/last_remote_path", path)
     
     def load_last_remote_path(self) -> str:
         """Load last used remote directory"""
-        return self.settings.value("files/last_remote_path", "/sdcard")
+        return self._get("files/last_remote_path", "/sdcard")
@@ -1,9 +1,12 @@
 """Application Manager - APK installation and app management"""
 
 import asyncio
+import functools
 import logging
+import re
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 from PySide6.QtCore import QObject, Signal
 
@@ -11,8 +14,17 @@ from utils.adb_wrapper import ADBWrapper
 
 logger = logging.getLogger(__name__)
 
+# Zero-width split point before each inner capital ("MyApp" -> "My App")
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
 
-@dataclass
+# One line of `pm list packages -f`: "package:<apk path>=<name>"
+_PM_LIST_RE = re.compile(r'^package:(?:(.+?\.apk)=)?(\S+?)\r?$', re.M)
+
+# Separates the sections of the combined package listing command
+_PM_SECTION = "__PM_SECTION__"
+
+
+@dataclass(slots=True, frozen=True)
 class Package:
     """Represents an installed application package"""
     package_name: str
@@ -46,37 +58,36 @@ class AppManager(QObject):
     ) -> List[Package]:
         """List installed packages (filter: all/user/system/enabled/disabled)"""
         try:
-            cmd = "pm list packages"
-            
-            if filter_type == 'user':
-                cmd += " -3"
-            elif filter_type == 'system':
-                cmd += " -s"
-            elif filter_type == 'enabled':
-                cmd += " -e"
-            elif filter_type == 'disabled':
-                cmd += " -d"
-            
-            output = await self.adb.shell(cmd, device)
-            
-            packages = []
-            for line in output.strip().split('\n'):
-                if not line.startswith('package:'):
+            listing, system_output, disabled_output = await self._run_package_listings(device)
+            system_set = self._parse_package_names(system_output)
+            disabled_set = self._parse_package_names(disabled_output)
+            
+            decorated = []
+            for apk_path, package_name in _PM_LIST_RE.findall(listing):
+                is_system = package_name in system_set
+                is_enabled = package_name not in disabled_set
+                
+                if filter_type == 'user' and is_system:
+                    continue
+                if filter_type == 'system' and not is_system:
+                    continue
+                if filter_type == 'enabled' and not is_enabled:
+                    continue
+                if filter_type == 'disabled' and is_enabled:
                     continue
-                package_name = line.replace('package:', '').strip()
                 
-                is_system = filter_type == 'system'
-                is_enabled = filter_type != 'disabled'
                 label = self._derive_label_from_package(package_name)
-                
-                packages.append(Package(
+                decorated.append((label.lower(), Package(
                     package_name=package_name,
                     label=label,
                     is_system=is_system,
-                    is_enabled=is_enabled
-                ))
+                    is_enabled=is_enabled,
+                    install_location=apk_path
+                )))
             
-            packages.sort(key=lambda p: p.display_name.lower())
+            # Sort on the precomputed key; ties keep listing order
+            decorated.sort(key=itemgetter(0))
+            packages = [package for _, package in decorated]
             
             logger.info(f"Found {len(packages)} packages (filter: {filter_type})")
             return packages
@@ -85,7 +96,50 @@ class AppManager(QObject):
             logger.error(f"Failed to list packages: {e}")
             return []
     
-    def _derive_label_from_package(self, package_name: str) -> str:
+    async def _run_package_listings(self, device: str) -> Tuple[str, str, str]:
+        """
+        Get the full, system and disabled package listings
+        
+        Args:
+            device: Device serial number
+            
+        Returns:
+            Tuple of (full listing with APK paths, system packages, disabled packages)
+        """
+        session = self.adb.session(device)
+        
+        # One round trip: full listing, then the system and disabled
+        # sets used to flag each package regardless of the filter
+        cmd = (
+            f"pm list packages -f; echo {_PM_SECTION}; "
+            f"pm list packages -s; echo {_PM_SECTION}; "
+            f"pm list packages -d"
+        )
+        output = await session.run(cmd)
+        
+        sections = output.split(_PM_SECTION)
+        if len(sections) == 3:
+            return sections[0], sections[1], sections[2]
+        
+        logger.warning(f"Unexpected combined package listing, querying separately: {output[:500]!r}")
+        return (
+            await session.run("pm list packages -f"),
+            await session.run("pm list packages -s"),
+            await session.run("pm list packages -d"),
+        )
+    
+    @staticmethod
+    def _parse_package_names(output: str) -> set:
+        """Collect package names from plain `pm list packages` output"""
+        return {
+            line.split(':', 1)[1].strip()
+            for line in output.splitlines()
+            if line.startswith('package:')
+        }
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _derive_label_from_package(package_name: str) -> str:
         """Derive human-readable label from package name"""
         parts = package_name.split('.')
         if not parts:
@@ -96,13 +150,7 @@ class AppManager(QObject):
         if name in ('app', 'android', 'google', 'core', 'service', 'services'):
             if len(parts) >= 2:
                 name = parts[-2]
-        result = ""
-        for char in name:
-            if char.isupper() and result:
-                result += " "
-            result += char
-        
-        return result.capitalize() if result else package_name
+        return _CAMEL_RE.sub(' ', name).capitalize() or package_name
     
     async def install_apk(
         self,
@@ -150,7 +198,7 @@ class AppManager(QObject):
     async def disable_package(self, device: str, package: str) -> bool:
         """Disable package"""
         try:
-            await self.adb.shell(f"pm disable-user {package}", device)
+            await self.adb.session(device).run(f"pm disable-user {package}")
             logger.info(f"Disabled {package}")
             return True
         except Exception as e:
@@ -160,7 +208,7 @@ class AppManager(QObject):
     async def enable_package(self, device: str, package: str) -> bool:
         """Enable package"""
         try:
-            await self.adb.shell(f"pm enable {package}", device)
+            await self.adb.session(device).run(f"pm enable {package}")
             logger.info(f"Enabled {package}")
             return True
         except Exception as e:
@@ -170,33 +218,55 @@ class AppManager(QObject):
     async def clear_app_data(self, device: str, package: str) -> bool:
         """Clear application data"""
         try:
-            await self.adb.shell(f"pm clear {package}", device)
+            await self.adb.session(device).run(f"pm clear {package}")
             logger.info(f"Cleared data for {package}")
             return True
         except Exception as e:
             logger.error(f"Failed to clear data for {package}: {e}")
             return False
     
+    @staticmethod
+    def _clear_cache_cmd(package: str) -> str:
+        """Shell fragment that wipes a package's cache and echoes its name if installed"""
+        return (
+            f"pm path {package} >/dev/null 2>&1 && "
+            f"{{ rm -rf /data/data/{package}/cache/*; echo {package}; }}"
+        )
+    
     async def clear_app_cache(self, device: str, package: str) -> bool:
         """Clear application cache"""
         try:
-            output = await self.adb.shell(f"pm path {package}", device)
-            if not output:
+            output = await self.adb.session(device).run(self._clear_cache_cmd(package))
+            if package not in output.split():
                 return False
             
-            await self.adb.shell(f"rm -rf /data/data/{package}/cache/*", device)
             logger.info(f"Cleared cache for {package}")
             return True
         except Exception as e:
             logger.error(f"Failed to clear cache for {package}: {e}")
             return False
     
+    async def clear_app_caches(self, device: str, packages: List[str]) -> List[str]:
+        """Clear cache for several packages in one shell call, returning those cleared"""
+        if not packages:
+            return []
+        try:
+            cmd = "; ".join(self._clear_cache_cmd(p) for p in packages)
+            output = await self.adb.session(device).run(cmd)
+            cleared = set(output.split())
+            result = [p for p in packages if p in cleared]
+            logger.info(f"Cleared cache for {len(result)}/{len(packages)} packages")
+            return result
+        except Exception as e:
+            logger.error(f"Failed to clear app caches: {e}")
+            return []
+    
     async def launch_app(self, device: str, package: str) -> bool:
         """Launch application"""
         try:
-            output = await self.adb.shell(
-                f"cmd package resolve-activity --brief {package} | tail -n 1",
-                device
+            session = self.adb.session(device)
+            output = await session.run(
+                f"cmd package resolve-activity --brief {package} | tail -n 1"
             )
             
             if not output or '/' not in output:
@@ -204,7 +274,7 @@ class AppManager(QObject):
                 return False
             
             activity = output.strip()
-            await self.adb.shell(f"am start -n {activity}", device)
+            await session.run(f"am start -n {activity}")
             logger.info(f"Launched {package}")
             return True
             
@@ -8,16 +8,15 @@ device state monitoring using Qt signals.
 import asyncio
 import logging
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from PySide6.QtCore import QObject, Signal, QTimer
 
 from utils.adb_wrapper import ADBWrapper, DeviceUnauthorizedError
-from utils.async_helper import is_async_busy, safe_ensure_future
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Represents an Android device"""
     serial: str
@@ -27,6 +26,7 @@ class Device:
     android_version: Optional[str] = None
     sdk_version: Optional[str] = None
     cpu_abi: Optional[str] = None
+    details_loaded: bool = field(default=False, repr=False, compare=False)
     
     @property
     def is_authorized(self) -> bool:
@@ -49,6 +49,26 @@ class Device:
         
         return serial
     
+    async def ensure_details(self, adb: ADBWrapper) -> None:
+        """
+        Load the extended properties not fetched during device scans
+        
+        Args:
+            adb: ADB wrapper instance
+        """
+        if self.details_loaded or not self.is_authorized:
+            return
+        
+        props = await adb.get_props(self.serial, [
+            'ro.build.version.release',
+            'ro.build.version.sdk',
+            'ro.product.cpu.abi',
+        ])
+        self.android_version = props.get('ro.build.version.release')
+        self.sdk_version = props.get('ro.build.version.sdk')
+        self.cpu_abi = props.get('ro.product.cpu.abi')
+        self.details_loaded = True
+    
     def __str__(self) -> str:
         return f"{self.display_name} ({self.serial})"
 
@@ -79,11 +99,55 @@ class DeviceManager(QObject):
         super().__init__()
         self.adb = adb
         self._devices: Dict[str, Device] = {}
-        self._monitor_timer: Optional[QTimer] = None
+        self._track_task: Optional[asyncio.Task] = None
         self._monitoring = False
-        self._check_in_progress = False  # Prevent concurrent checks
+        self._monitor_interval = 2000
+        # (serial, state) pairs from the last check; None forces a full diff
+        self._last_fp: Optional[frozenset] = None
         logger.info("Device Manager initialized")
     
+    async def _list_serials(self) -> List[Dict[str, str]]:
+        """
+        List attached devices without querying their properties
+        
+        Returns:
+            Raw device dicts from `adb devices -l`
+        """
+        return await self.adb.get_devices()
+    
+    async def _hydrate_device(self, dev_info: Dict[str, str]) -> Device:
+        """
+        Build a Device and fill in the properties shown in device lists
+        
+        Extended properties are loaded on demand via Device.ensure_details().
+        
+        Args:
+            dev_info: Raw device dict from `adb devices -l`
+        
+        Returns:
+            Device object
+        """
+        serial = dev_info['serial']
+        state = dev_info['state']
+        
+        device = Device(
+            serial=serial,
+            state=state,
+            model=dev_info.get('model'),
+        )
+        
+        if state == "device":
+            try:
+                props = await self.adb.get_props(
+                    serial, ['ro.product.model', 'ro.product.manufacturer']
+                )
+                device.model = props.get('ro.product.model', device.model)
+                device.manufacturer = props.get('ro.product.manufacturer')
+            except Exception as e:
+                logger.warning(f"Failed to get device info for {serial}: {e}")
+        
+        return device
+    
     async def scan_devices(self) -> List[Device]:
         """
         Scan for connected devices
@@ -92,34 +156,16 @@ class DeviceManager(QObject):
             List of Device objects
         """
         try:
-            device_list = await self.adb.get_devices()
-            devices = []
+            device_list = await self._list_serials()
             
-            for dev_info in device_list:
-                serial = dev_info['serial']
-                state = dev_info['state']
-                
-                device = Device(
-                    serial=serial,
-                    state=state,
-                    model=dev_info.get('model'),
-                )
-                
-                if state == "device":
-                    try:
-                        props = await self.adb.get_device_info(serial)
-                        device.model = props.get('ro.product.model', device.model)
-                        device.manufacturer = props.get('ro.product.manufacturer')
-                        device.android_version = props.get('ro.build.version.release')
-                        device.sdk_version = props.get('ro.build.version.sdk')
-                        device.cpu_abi = props.get('ro.product.cpu.abi')
-                    except Exception as e:
-                        logger.warning(f"Failed to get device info for {serial}: {e}")
-                
-                devices.append(device)
-                logger.info(f"Found device: {device}")
+            # Devices are independent; fetch their properties concurrently
+            devices = await asyncio.gather(
+                *(self._hydrate_device(dev_info) for dev_info in device_list)
+            )
+            for device in devices:
+                logger.info("Found device: %s", device)
             
-            return devices
+            return list(devices)
             
         except Exception as e:
             logger.error(f"Device scan failed: {e}")
@@ -163,9 +209,9 @@ class DeviceManager(QObject):
             logger.error("Wireless connection failed")
             return None
         
-        devices = await self.scan_devices()
-        for device in devices:
-            if ip in device.serial:
+        for dev_info in await self._list_serials():
+            if ip in dev_info['serial']:
+                device = await self._hydrate_device(dev_info)
                 logger.info(f"Wireless connection successful: {device}")
                 return device
         
@@ -194,18 +240,25 @@ class DeviceManager(QObject):
         Returns:
             Device object or None if not found
         """
-        devices = await self.scan_devices()
-        for device in devices:
-            if device.serial == serial:
-                return device
+        try:
+            for dev_info in await self._list_serials():
+                if dev_info['serial'] == serial:
+                    device = await self._hydrate_device(dev_info)
+                    await device.ensure_details(self.adb)
+                    return device
+        except Exception as e:
+            logger.error(f"Failed to get device info for {serial}: {e}")
         return None
     
     def start_monitoring(self, interval_ms: int = 2000):
         """
         Start monitoring for device changes
         
+        Subscribes to the adb server's device tracking stream, so updates are
+        pushed as devices come and go instead of being polled.
+        
         Args:
-            interval_ms: Polling interval in milliseconds
+            interval_ms: Delay before reconnecting if the adb server goes away
         """
         if self._monitoring:
             logger.warning("Device monitoring already started")
@@ -213,32 +266,35 @@ class DeviceManager(QObject):
         
         self._monitoring = True
         self._monitor_interval = interval_ms
-        logger.info(f"Device monitoring started (interval: {interval_ms}ms)")
+        logger.info("Device monitoring started")
         
-        # Initial scan after a short delay to ensure event loop is running
-        QTimer.singleShot(100, self._on_timer_tick)
+        # Start after a short delay to ensure event loop is running
+        QTimer.singleShot(100, self._start_tracking)
     
-    def _on_timer_tick(self):
-        """Handle timer tick - schedule async device check"""
-        if not self._monitoring:
+    def _start_tracking(self):
+        """Launch the device tracking task"""
+        if not self._monitoring or self._track_task:
             return
-        
-        # Skip if a check is already in progress or if another async op is busy
-        if self._check_in_progress or is_async_busy():
-            QTimer.singleShot(500, self._on_timer_tick)
-            return
-        
-        task = safe_ensure_future(self._check_devices_and_reschedule())
-        if task is None:
-            QTimer.singleShot(500, self._on_timer_tick)
+        self._track_task = asyncio.ensure_future(self._track_devices())
     
-    async def _check_devices_and_reschedule(self):
-        """Check devices then reschedule the next check"""
+    async def _track_devices(self):
+        """Consume device list updates from the adb server, reconnecting on loss"""
         try:
-            await self._check_devices()
+            while self._monitoring:
+                try:
+                    async for device_list in self.adb.track_devices():
+                        await self._apply_device_list(device_list)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Device tracking interrupted: {e}")
+                
+                if self._monitoring:
+                    await asyncio.sleep(self._monitor_interval / 1000)
+        except asyncio.CancelledError:
+            logger.debug("Device tracking cancelled")
         finally:
-            if self._monitoring:
-                QTimer.singleShot(self._monitor_interval, self._on_timer_tick)
+            self._track_task = None
     
     def stop_monitoring(self):
         """Stop monitoring for device changes"""
@@ -246,50 +302,67 @@ class DeviceManager(QObject):
             return
         
         self._monitoring = False
+        if self._track_task:
+            self._track_task.cancel()
         logger.info("Device monitoring stopped")
     
-    async def _check_devices(self):
-        """Check for device changes and emit signals"""
-        if self._check_in_progress:
+    async def _apply_device_list(self, device_list: List[Dict[str, str]]):
+        """
+        Diff a device list against the cache and emit signals for changes
+        
+        Only devices that are new or whose state changed are hydrated.
+        
+        Args:
+            device_list: Raw device dicts with 'serial' and 'state' keys
+        """
+        # Fast path: nothing attached or detached and no state changes
+        new_fp = frozenset((d['serial'], d['state']) for d in device_list)
+        if new_fp == self._last_fp:
             return
+        self._last_fp = new_fp
         
-        self._check_in_progress = True
         try:
-            current_devices = await self.scan_devices()
-            current_serials = {dev.serial for dev in current_devices}
+            current_serials = {d['serial'] for d in device_list}
             previous_serials = set(self._devices.keys())
             
             devices_changed = False
             
-            for device in current_devices:
-                if device.serial not in previous_serials:
-                    logger.info(f"New device detected: {device}")
+            changed = [
+                dev_info for dev_info in device_list
+                if (cached := self._devices.get(dev_info['serial'])) is None
+                or cached.state != dev_info['state']
+            ]
+            hydrated = await asyncio.gather(
+                *(self._hydrate_device(dev_info) for dev_info in changed)
+            )
+            
+            for device in hydrated:
+                cached = self._devices.get(device.serial)
+                self._devices[device.serial] = device
+                devices_changed = True
+                
+                if cached is None:
+                    logger.info("New device detected: %s", device)
                     self.device_connected.emit(device)
-                    devices_changed = True
-                    
-                    if not device.is_authorized:
-                        self.device_unauthorized.emit(device.serial)
                 
-                self._devices[device.serial] = device
+                if not device.is_authorized:
+                    self.device_unauthorized.emit(device.serial)
             
             for serial in previous_serials - current_serials:
                 logger.info(f"Device disconnected: {serial}")
                 self.device_disconnected.emit(serial)
                 del self._devices[serial]
+                self.adb.close_session(serial)
                 devices_changed = True
             
-            # Only emit updated list if devices actually changed
             if devices_changed:
-                logger.debug(f"DeviceManager: Emitting devices_updated with {len(self._devices)} devices")
+                logger.debug("DeviceManager: Emitting devices_updated with %d devices", len(self._devices))
                 self.devices_updated.emit(list(self._devices.values()))
             
-        except RuntimeError as e:
-            if "Cannot enter into task" not in str(e):
-                logger.error(f"Device check runtime error: {e}")
         except Exception as e:
+            # Force a full re-diff on the next update (even one with no devices)
+            self._last_fp = None
             logger.error(f"Device check failed: {e}")
-        finally:
-            self._check_in_progress = False
     
     def get_connected_devices(self) -> List[Device]:
         """
@@ -6,9 +6,16 @@ transferring, and managing files and directories.
 """
 
 import asyncio
+import functools
+import io
 import logging
+import shlex
+import tarfile
+import time
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple, AsyncIterator
 from dataclasses import dataclass
 from PySide6.QtCore import QObject, Signal
 
@@ -16,8 +23,27 @@ from utils.adb_wrapper import ADBWrapper
 
 logger = logging.getLogger(__name__)
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
-@dataclass
+# Directory listings are reused for this many seconds unless invalidated
+_LISTING_TTL = 10.0
+_LISTING_CACHE_SIZE = 128
+
+# Files below this size are bundled into one tar stream per directory
+_SMALL_FILE_LIMIT = 64 * 1024
+
+# Echoed by the device only if extraction succeeded; exec-in itself exits 0 regardless
+_TAR_OK_MARKER = "__TAR_OK__"
+
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    """Format a Unix time given in whole minutes; entries often share a minute"""
+    return datetime.fromtimestamp(minute * 60).strftime('%Y-%m-%d %H:%M')
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Represents a file or directory on the device"""
     name: str
@@ -33,11 +59,9 @@ class FileInfo:
         if self.is_directory:
             return "<DIR>"
         
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if self.size < 1024.0:
-                return f"{self.size:.1f} {unit}"
-            self.size /= 1024.0
-        return f"{self.size:.1f} TB"
+        # Each unit is 2**10 of the previous one, so bit_length picks it directly
+        index = min(max(self.size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{self.size / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 class FileManager(QObject):
@@ -61,15 +85,38 @@ class FileManager(QObject):
         """
         super().__init__()
         self.adb = adb
+        # (device, path) -> (timestamp, listing), least recently used first
+        self._listing_cache: OrderedDict = OrderedDict()
         logger.info("File Manager initialized")
     
-    async def list_directory(self, device: str, path: str) -> List[FileInfo]:
+    def _invalidate_listing(self, device: str, path: str):
+        """
+        Drop cached listings affected by a change to path
+        
+        Args:
+            device: Device serial number
+            path: Path that was created, modified or removed
+        """
+        path = '/' + '/'.join(part for part in path.split('/') if part)
+        parent = path.rpartition('/')[0] + '/'
+        prefix = path + '/'
+        for key in [k for k in self._listing_cache
+                    if k[0] == device and (k[1] == parent or k[1].startswith(prefix))]:
+            del self._listing_cache[key]
+    
+    async def list_directory(
+        self,
+        device: str,
+        path: str,
+        use_cache: bool = True
+    ) -> List[FileInfo]:
         """
         List contents of a directory on the device
         
         Args:
             device: Device serial number
             path: Directory path to list
+            use_cache: Return a recent cached listing if one exists
         
         Returns:
             List of FileInfo objects
@@ -78,47 +125,49 @@ class FileManager(QObject):
             if not path.endswith('/'):
                 path = path + '/'
             
+            key = (device, path)
+            cached = self._listing_cache.get(key)
+            if use_cache and cached and time.monotonic() - cached[0] < _LISTING_TTL:
+                self._listing_cache.move_to_end(key)
+                return list(cached[1])
+            
             logger.info(f"FileManager: Listing directory {path} on device {device}")
             
-            output = await self.adb.shell(f"ls -la {path}", device)
+            # One stat call with a fixed, delimiter-separated schema instead of
+            # parsing locale-dependent `ls -la` columns. Unmatched globs are
+            # passed through literally and their errors discarded.
+            quoted = shlex.quote(path)
+            output = await self.adb.session(device).run(
+                f"stat -c '%F|%s|%A|%Y|%n' -- "
+                f"{quoted}* {quoted}.[!.]* {quoted}..?* 2>/dev/null"
+            )
             
-            logger.debug(f"FileManager: ls output length: {len(output)} chars")
+            logger.debug(f"FileManager: stat output length: {len(output)} chars")
             
             files = []
-            for line in output.strip().split('\n'):
-                line = line.strip()  # Remove \r and other whitespace
-                if not line or line.startswith('total'):
-                    continue
-                
-                # Android ls -la format: perms links owner group size date time name
-                # Example: drwxrws--- 2 u0_a209 media_rw 3452 2026-02-05 08:56 Alarms
-                parts = line.split(None, 7)  # Split into max 8 parts
-                if len(parts) < 8:
-                    print(f">>> FILE_MANAGER: Skipping line (only {len(parts)} parts): {line[:50]}")
+            for row in (line.rstrip('\r').split('|', 4) for line in output.split('\n') if line):
+                if len(row) < 5:
                     continue
-                
-                permissions = parts[0]
-                size_str = parts[4]
-                name = parts[7]  # Name is the 8th column (index 7)
-                
-                if name in ['.', '..']:
-                    continue
-                
-                is_dir = permissions.startswith('d')
-                size = 0 if is_dir else int(size_str) if size_str.isdigit() else 0
-                
-                file_path = f"{path}{name}"
+                file_type, size, permissions, mtime, file_path = row
+                is_dir = file_type == 'directory'
                 
                 files.append(FileInfo(
-                    name=name,
+                    name=file_path[len(path):],
                     path=file_path,
                     is_directory=is_dir,
-                    size=size,
-                    permissions=permissions
+                    size=0 if is_dir else int(size),
+                    permissions=permissions,
+                    modified_time=_format_minute(int(mtime) // 60)
                 ))
             
             logger.info(f"FileManager: Listed {len(files)} items in {path}")
-            return files
+            
+            self._listing_cache[key] = (time.monotonic(), files)
+            self._listing_cache.move_to_end(key)
+            if len(self._listing_cache) > _LISTING_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+            
+            return list(files)
             
         except Exception as e:
             logger.error(f"FileManager: Failed to list directory {path}: {e}")
@@ -146,7 +195,7 @@ class FileManager(QObject):
         try:
             logger.info(f"Pushing {local_path} to {remote_path}")
             
-            file_size = local_path.stat().st_size
+            file_size = (await asyncio.to_thread(local_path.stat)).st_size
             self.transfer_progress.emit(0, file_size, local_path.name)
             
             success = await self.adb.push_file(
@@ -156,6 +205,7 @@ class FileManager(QObject):
                 progress_callback
             )
             
+            self._invalidate_listing(device, remote_path)
             self.transfer_complete.emit(success, local_path.name)
             
             if success:
@@ -215,6 +265,161 @@ class FileManager(QObject):
             self.transfer_complete.emit(False, Path(remote_path).name)
             return False
     
+    def pull_stream(self, device: str, remote_path: str) -> AsyncIterator[bytes]:
+        """
+        Stream a file from the device as it is read, without a local copy
+        
+        Useful for previews and hashing, where the data is consumed once.
+        
+        Args:
+            device: Device serial number
+            remote_path: Remote file path
+        
+        Returns:
+            Async iterator of file data chunks
+        """
+        return self.adb.pull_stream(remote_path, device)
+    
+    async def push_files(
+        self,
+        device: str,
+        pairs: List[Tuple[Path, str]],
+        concurrency: int = 6
+    ) -> List[bool]:
+        """
+        Push several files to the device concurrently
+        
+        Args:
+            device: Device serial number
+            pairs: (local_path, remote_path) tuples
+            concurrency: Maximum number of transfers in flight
+        
+        Returns:
+            Per-file success flags, in the order of pairs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def push_one(local_path: Path, remote_path: str) -> bool:
+            async with semaphore:
+                return await self.push_file(device, local_path, remote_path)
+        
+        return await asyncio.gather(
+            *(push_one(local_path, remote_path) for local_path, remote_path in pairs)
+        )
+    
+    async def pull_files(
+        self,
+        device: str,
+        pairs: List[Tuple[str, Path]],
+        concurrency: int = 6
+    ) -> List[bool]:
+        """
+        Pull several files from the device concurrently
+        
+        Args:
+            device: Device serial number
+            pairs: (remote_path, local_path) tuples
+            concurrency: Maximum number of transfers in flight
+        
+        Returns:
+            Per-file success flags, in the order of pairs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def pull_one(remote_path: str, local_path: Path) -> bool:
+            async with semaphore:
+                return await self.pull_file(device, remote_path, local_path)
+        
+        return await asyncio.gather(
+            *(pull_one(remote_path, local_path) for remote_path, local_path in pairs)
+        )
+    
+    async def push_files_batched(
+        self,
+        device: str,
+        pairs: List[Tuple[Path, str]],
+        concurrency: int = 6
+    ) -> List[bool]:
+        """
+        Push several files, bundling small ones into one transfer per directory
+        
+        Small files are packed into an in-memory tar and extracted on the
+        device through `adb exec-in`, saving a sync handshake per file.
+        Larger files go through push_files().
+        
+        Args:
+            device: Device serial number
+            pairs: (local_path, remote_path) tuples
+            concurrency: Maximum number of large transfers in flight
+        
+        Returns:
+            Per-file success flags, in the order of pairs
+        """
+        results = [False] * len(pairs)
+        small_by_dir = {}
+        large = []
+        
+        sizes = await asyncio.to_thread(self._local_sizes, [local_path for local_path, _ in pairs])
+        
+        for index, (local_path, remote_path) in enumerate(pairs):
+            remote_dir, _, name = remote_path.rpartition('/')
+            size = sizes[index]
+            if name and size is not None and size < _SMALL_FILE_LIMIT:
+                small_by_dir.setdefault(remote_dir or '/', []).append((index, local_path, name))
+            else:
+                large.append(index)
+        
+        for remote_dir, entries in small_by_dir.items():
+            try:
+                data = await asyncio.to_thread(
+                    self._build_tar, [(local_path, name) for _, local_path, name in entries]
+                )
+                output = await self.adb.exec_in(
+                    f"cd {shlex.quote(remote_dir)} && tar xf - && echo {_TAR_OK_MARKER}",
+                    data, device
+                )
+                success = output is not None and _TAR_OK_MARKER in output
+                if output is not None and not success:
+                    logger.error(f"Batched push to {remote_dir} failed on the device: {output.strip()}")
+            except Exception as e:
+                logger.error(f"Batched push to {remote_dir} failed: {e}")
+                success = False
+            
+            if success:
+                logger.info(f"Pushed {len(entries)} small files to {remote_dir} in one batch")
+            for index, local_path, name in entries:
+                results[index] = success
+                self._invalidate_listing(device, f"{remote_dir}/{name}")
+                self.transfer_complete.emit(success, local_path.name)
+        
+        large_results = await self.push_files(
+            device, [pairs[index] for index in large], concurrency
+        )
+        for index, success in zip(large, large_results):
+            results[index] = success
+        
+        return results
+    
+    @staticmethod
+    def _local_sizes(paths: List[Path]) -> List[Optional[int]]:
+        """Stat local files, with None for any that cannot be read"""
+        sizes = []
+        for path in paths:
+            try:
+                sizes.append(path.stat().st_size)
+            except OSError:
+                sizes.append(None)
+        return sizes
+    
+    @staticmethod
+    def _build_tar(entries: List[Tuple[Path, str]]) -> bytes:
+        """Pack (local_path, archive_name) entries into an uncompressed tar"""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w') as tar:
+            for local_path, name in entries:
+                tar.add(local_path, arcname=name, recursive=False)
+        return buffer.getvalue()
+    
     async def delete_file(self, device: str, path: str) -> bool:
         """
         Delete a file or directory from the device
@@ -227,7 +432,8 @@ class FileManager(QObject):
             True if successful
         """
         try:
-            await self.adb.shell(f"rm -rf '{path}'", device)
+            await self.adb.session(device).run(f"rm -rf -- {shlex.quote(path)}")
+            self._invalidate_listing(device, path)
             logger.info(f"Deleted {path}")
             return True
         except Exception as e:
@@ -246,7 +452,8 @@ class FileManager(QObject):
             True if successful
         """
         try:
-            await self.adb.shell(f"mkdir -p '{path}'", device)
+            await self.adb.session(device).run(f"mkdir -p -- {shlex.quote(path)}")
+            self._invalidate_listing(device, path)
             logger.info(f"Created directory {path}")
             return True
         except Exception as e:
@@ -266,7 +473,10 @@ class FileManager(QObject):
             True if successful
         """
         try:
-            await self.adb.shell(f"chmod {permissions} '{path}'", device)
+            await self.adb.session(device).run(
+                f"chmod {shlex.quote(permissions)} -- {shlex.quote(path)}"
+            )
+            self._invalidate_listing(device, path)
             logger.info(f"Changed permissions of {path} to {permissions}")
             return True
         except Exception as e:
@@ -7,7 +7,11 @@ filtering and search capabilities.
 
 import asyncio
 import logging
-from typing import Optional, Dict
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal
 
@@ -15,23 +19,77 @@ from utils.adb_wrapper import ADBWrapper
 
 logger = logging.getLogger(__name__)
 
+# -v time: "MM-DD HH:MM:SS.mmm L/TAG( PID): MESSAGE" (PID optional)
+_TIME_RE = re.compile(
+    rb'^(\d\d-\d\d \d\d:\d\d:\d\d\.\d{3})\s+([VDIWEFA])/'
+    rb'([^(:]*?)\s*(?:\(\s*(\d+)\))?:\s*(.*)$'
+)
+
+# -v threadtime: "MM-DD HH:MM:SS.mmm  PID  TID L TAG: MESSAGE"
+_THREADTIME_RE = re.compile(
+    rb'^(\d\d-\d\d \d\d:\d\d:\d\d\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEFA])\s+'
+    rb'(?:([^:]*?)\s*:)?\s*(.*)$'
+)
+
+# Level bytes that pass a minimum-level filter, most verbose first
+_LEVELS_AT_OR_ABOVE = {
+    'V': frozenset(b'VDIWEFA'),
+    'D': frozenset(b'DIWEFA'),
+    'I': frozenset(b'IWEFA'),
+    'W': frozenset(b'WEFA'),
+    'E': frozenset(b'EFA'),
+    'F': frozenset(b'FA'),
+}
+
+# Exports smaller than this are searched in a single worker thread
+_PARALLEL_SEARCH_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _line_aligned_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """Split a file into up to `parts` byte ranges that start and end on line boundaries"""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _grep_chunk(path: str, start: int, end: int, pattern: str) -> List[str]:
+    """Return lines in [start, end) of a file that match pattern (runs in a worker process)"""
+    regex = re.compile(pattern)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8', errors='replace')
+    return [line for line in text.splitlines() if regex.search(line)]
+
 
 class LogcatStreamer(QObject):
     """
     Streams logcat output from Android devices
     
     Signals:
-        log_entry: Emitted for each log line (dict with timestamp, level, tag, message)
+        log_entries: Emitted with batches of parsed log lines (dicts with timestamp, level, tag, message)
         streaming_started: Emitted when streaming starts
         streaming_stopped: Emitted when streaming stops
     """
     
-    log_entry = Signal(dict)  # {timestamp, level, tag, pid, message}
+    log_entries = Signal(list)  # [{timestamp, level, tag, pid, message}, ...]
     streaming_started = Signal()
     streaming_stopped = Signal()
     
     LEVELS = ['V', 'D', 'I', 'W', 'E', 'F']
     
+    # Entries are emitted once BATCH_SIZE are pending, or after
+    # BATCH_INTERVAL seconds, whichever comes first
+    BATCH_SIZE = 100
+    BATCH_INTERVAL = 0.05
+    
+    READ_CHUNK_SIZE = 65536
+    
     def __init__(self, adb: ADBWrapper):
         """
         Initialize Logcat Streamer
@@ -44,8 +102,23 @@ class LogcatStreamer(QObject):
         self._streaming = False
         self._stream_task: Optional[asyncio.Task] = None
         self._filters: Dict[str, str] = {}
+        self._cmd = self._build_cmd()
         logger.info("Logcat Streamer initialized")
     
+    def _build_cmd(self) -> list:
+        """Assemble the logcat command for the current filters"""
+        cmd = ["logcat", "-v", "time"]
+        
+        if 'level' in self._filters:
+            level = self._filters['level']
+            cmd.extend(["-s", f"*:{level}"])
+        
+        if 'tag' in self._filters:
+            tag = self._filters['tag']
+            cmd.extend(["-s", f"{tag}:*"])
+        
+        return cmd
+    
     async def start_streaming(
         self,
         device: str,
@@ -56,29 +129,21 @@ class LogcatStreamer(QObject):
         
         Args:
             device: Device serial number
-            filters: Optional filters dict with keys: level, tag, package
+            filters: Optional filters dict replacing the current ones (keys: level, tag, package)
         """
         if self._streaming:
             logger.warning("Logcat streaming already active")
             return
         
         self._streaming = True
-        self._filters = filters or {}
-        
-        cmd = ["logcat", "-v", "time"]
-        
-        if 'level' in self._filters:
-            level = self._filters['level']
-            cmd.extend(["-s", f"*:{level}"])
-        
-        if 'tag' in self._filters:
-            tag = self._filters['tag']
-            cmd.extend(["-s", f"{tag}:*"])
+        if filters is not None:
+            self._filters = dict(filters)
+            self._cmd = self._build_cmd()
         
         logger.info(f"Starting logcat stream with filters: {self._filters}")
         
         self._stream_task = asyncio.ensure_future(
-            self._stream_logcat(device, cmd)
+            self._stream_logcat(device, self._cmd)
         )
         
         self.streaming_started.emit()
@@ -92,6 +157,8 @@ class LogcatStreamer(QObject):
             cmd: Logcat command arguments
         """
         process = None
+        batch = []
+        last_flush = time.monotonic()
         try:
             full_cmd = [str(self.adb.adb_path), "-s", device] + cmd
             
@@ -114,33 +181,64 @@ class LogcatStreamer(QObject):
                 **kwargs
             )
             
+            # Read in large chunks to cut awaits; lines stay as bytes so
+            # rejected lines are never decoded
+            pending = b''
             while self._streaming and process.stdout:
-                line = await process.stdout.readline()
-                if not line:
+                # Wait no longer than the batch interval while entries are pending
+                timeout = None
+                if batch:
+                    timeout = max(0.0, self.BATCH_INTERVAL - (time.monotonic() - last_flush))
+                try:
+                    chunk = await asyncio.wait_for(process.stdout.read(self.READ_CHUNK_SIZE), timeout)
+                except asyncio.TimeoutError:
+                    self.log_entries.emit(batch)
+                    batch = []
+                    last_flush = time.monotonic()
+                    continue
+                if not chunk:
                     break
                 
-                try:
-                    line_str = line.decode('utf-8', errors='replace').strip()
-                    if not line_str:
+                pending += chunk
+                complete, sep, pending = pending.rpartition(b'\n')
+                if not sep:
+                    # No complete line yet; rpartition left it all in `pending`
+                    continue
+                
+                package = self._filters.get('package')
+                allowed_levels = _LEVELS_AT_OR_ABOVE.get(self._filters.get('level'))
+                for line in complete.split(b'\n'):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    
+                    # "-v time" puts the level at a fixed column ("MM-DD HH:MM:SS.mmm L/");
+                    # reject filtered-out levels before running the full parse
+                    if (allowed_levels and line[20:21] == b'/'
+                            and line[19] not in allowed_levels):
                         continue
                     
-                    entry = self._parse_log_line(line_str)
-                    if entry:
-                        if 'package' in self._filters:
-                            package = self._filters['package']
-                            if package not in entry.get('tag', ''):
-                                continue
-                        
-                        self.log_entry.emit(entry)
+                    entry = self._parse_log_line(line)
+                    if entry is None:
+                        continue
+                    if package and package not in entry['tag']:
+                        continue
+                    batch.append(entry)
                 
-                except Exception as e:
-                    logger.debug(f"Failed to parse log line: {e}")
+                if batch and (len(batch) >= self.BATCH_SIZE
+                              or time.monotonic() - last_flush >= self.BATCH_INTERVAL):
+                    self.log_entries.emit(batch)
+                    batch = []
+                    last_flush = time.monotonic()
         
         except asyncio.CancelledError:
             logger.debug("Logcat streaming cancelled")
         except Exception as e:
             logger.error(f"Logcat streaming failed: {e}")
         finally:
+            if batch:
+                self.log_entries.emit(batch)
+            
             if process:
                 try:
                     if process.stdout:
@@ -166,99 +264,43 @@ class LogcatStreamer(QObject):
             self._streaming = False
             self.streaming_stopped.emit()
     
-    def _parse_log_line(self, line: str) -> Optional[Dict[str, str]]:
+    def _parse_log_line(self, line: bytes) -> Optional[Dict[str, str]]:
         """
-        Parse a logcat line into structured data
+        Parse a raw logcat line into structured data
+        
+        Only the captured fields are decoded, not the whole line.
         
         Args:
-            line: Raw logcat line
+            line: Raw logcat line bytes
         
         Returns:
             Dict with parsed fields or None if parsing fails
         """
-        try:
-            # Format for -v time: MM-DD HH:MM:SS.mmm LEVEL/TAG( PID): MESSAGE
-            # Example: 02-05 12:34:52.089 W/libperfmgr( 1234): Failed/write to node
-            
-            if len(line) < 20:
-                return None
-            
-            timestamp = line[:18].strip()
-            rest = line[18:].strip()
-            
-            if not rest:
-                return None
-            
-            level = rest[0] if rest else 'I'
-            
-            if len(rest) < 2 or rest[1] != '/':
-                return self._parse_threadtime(line)
-            
-            rest_after_slash = rest[2:]  # Skip "X/"
-            
-            paren_pos = rest_after_slash.find('(')
-            colon_pos = rest_after_slash.find(':')
-            
-            pid = ''
-            if paren_pos != -1 and paren_pos < colon_pos:
-                tag = rest_after_slash[:paren_pos].strip()
-                paren_end = rest_after_slash.find(')', paren_pos)
-                if paren_end != -1:
-                    pid = rest_after_slash[paren_pos+1:paren_end].strip()
-                    message_start = rest_after_slash.find(':', paren_end)
-                    if message_start != -1:
-                        message = rest_after_slash[message_start+1:].strip()
-                    else:
-                        message = rest_after_slash[paren_end+1:].strip()
-                else:
-                    message = rest_after_slash[paren_pos:].strip()
-            elif colon_pos != -1:
-                tag = rest_after_slash[:colon_pos].strip()
-                message = rest_after_slash[colon_pos+1:].strip()
-            else:
-                tag = rest_after_slash.strip()
-                message = ''
-            
+        match = _TIME_RE.match(line)
+        if match:
+            timestamp, level, tag, pid, message = match.groups()
             return {
-                'timestamp': timestamp,
-                'pid': pid,
+                'timestamp': timestamp.decode('ascii'),
+                'pid': pid.decode('ascii') if pid else '',
                 'tid': '',
-                'level': level,
-                'tag': tag,
-                'message': message
+                'level': level.decode('ascii'),
+                'tag': tag.decode('utf-8', errors='replace'),
+                'message': message.decode('utf-8', errors='replace')
             }
-            
-        except Exception as e:
-            logger.debug(f"Log line parse error: {e}")
-            return None
-    
-    def _parse_threadtime(self, line: str) -> Optional[Dict[str, str]]:
-        """Parse threadtime format as fallback"""
-        try:
-            if len(line) < 30:
-                return None
-            timestamp = line[:18]
-            rest = line[18:].strip()
-            parts = rest.split(None, 4)
-            if len(parts) < 5:
-                return None
-            pid, tid, level = parts[0], parts[1], parts[2]
-            tag_and_msg = parts[4]
-            if ':' in tag_and_msg:
-                tag, message = tag_and_msg.split(':', 1)
-            else:
-                tag, message = '', tag_and_msg
+        
+        match = _THREADTIME_RE.match(line)
+        if match:
+            timestamp, pid, tid, level, tag, message = match.groups()
             return {
-                'timestamp': timestamp,
-                'pid': pid,
-                'tid': tid,
-                'level': level,
-                'tag': tag.strip(),
-                'message': message.strip()
+                'timestamp': timestamp.decode('ascii'),
+                'pid': pid.decode('ascii'),
+                'tid': tid.decode('ascii'),
+                'level': level.decode('ascii'),
+                'tag': tag.decode('utf-8', errors='replace') if tag else '',
+                'message': message.decode('utf-8', errors='replace')
             }
-        except Exception:
-            return None
-
+        
+        return None
     
     async def stop_streaming(self):
         """Stop streaming logcat output"""
@@ -297,11 +339,13 @@ class LogcatStreamer(QObject):
         if package:
             self._filters['package'] = package
         
+        self._cmd = self._build_cmd()
         logger.info(f"Updated filters: {self._filters}")
     
     def clear_filters(self):
         """Clear all filters"""
         self._filters.clear()
+        self._cmd = self._build_cmd()
         logger.info("Cleared all filters")
     
     async def export_logs(self, device: str, output_path: str) -> bool:
@@ -318,10 +362,13 @@ class LogcatStreamer(QObject):
         try:
             logger.info(f"Exporting logcat to {output_path}")
             
-            output = await self.adb.shell("logcat -d", device)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(output)
+            # Stream the dump straight to disk instead of buffering it whole
+            f = await asyncio.to_thread(open, output_path, 'wb')
+            try:
+                async for chunk in self.adb.exec_out_stream("logcat -d", device, 1 << 20):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
             
             logger.info(f"Successfully exported logcat to {output_path}")
             return True
@@ -330,6 +377,47 @@ class LogcatStreamer(QObject):
             logger.error(f"Failed to export logcat: {e}")
             return False
     
+    async def search_export(self, path: str, pattern: str) -> List[str]:
+        """
+        Search an exported logcat file for lines matching a regex
+        
+        Large files are split into line-aligned ranges and scanned in
+        parallel worker processes, since the scan is CPU-bound.
+        
+        Args:
+            path: Exported logcat file path
+            pattern: Regular expression to search for
+        
+        Returns:
+            Matching lines, in file order
+        """
+        try:
+            re.compile(pattern)
+            
+            workers = os.cpu_count() or 1
+            size = await asyncio.to_thread(os.path.getsize, path)
+            if workers == 1 or size < _PARALLEL_SEARCH_MIN_BYTES:
+                return await asyncio.to_thread(_grep_chunk, path, 0, size, pattern)
+            
+            ranges = await asyncio.to_thread(_line_aligned_ranges, path, workers)
+            loop = asyncio.get_running_loop()
+            pool = ProcessPoolExecutor(max_workers=len(ranges))
+            try:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(pool, _grep_chunk, path, start, end, pattern)
+                    for start, end in ranges
+                ))
+            finally:
+                pool.shutdown(wait=False)
+            
+            matches = [line for part in results for line in part]
+            logger.info(f"Found {len(matches)} matching lines in {path}")
+            return matches
+            
+        except Exception as e:
+            logger.error(f"Failed to search {path}: {e}")
+            return []
+    
     def is_streaming(self) -> bool:
         """Check if currently streaming"""
         return self._streaming
@@ -5,14 +5,116 @@ Provides screen mirroring functionality using scrcpy subprocess.
 """
 
 import logging
-import asyncio
 import shutil
+import subprocess
+import sys
 from pathlib import Path
-from typing import Optional, Dict
-from PySide6.QtCore import QObject, Signal, QSettings, QTimer
+from typing import Optional, Dict, List
+from PySide6.QtCore import QObject, Signal, QSettings, QProcess
+
+from utils.async_helper import start_process, wait_for_process_exit
 
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS = sys.platform == 'win32'
+
+
+def _create_kill_on_close_job(pid: int) -> Optional[int]:
+    """
+    Put a process in a new Windows job object that kills its members on close.
+    
+    Children the process starts afterwards inherit the job, so closing the
+    returned handle terminates the whole tree and nothing else.
+    
+    Args:
+        pid: ID of the process to assign
+        
+    Returns:
+        Job handle, or None if the job could not be set up
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_ulonglong) for name in (
+            'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+            'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount'
+        )]
+    
+    class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ('PerProcessUserTimeLimit', ctypes.c_int64),
+            ('PerJobUserTimeLimit', ctypes.c_int64),
+            ('LimitFlags', wintypes.DWORD),
+            ('MinimumWorkingSetSize', ctypes.c_size_t),
+            ('MaximumWorkingSetSize', ctypes.c_size_t),
+            ('ActiveProcessLimit', wintypes.DWORD),
+            ('Affinity', ctypes.c_size_t),
+            ('PriorityClass', wintypes.DWORD),
+            ('SchedulingClass', wintypes.DWORD),
+        ]
+    
+    class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+            ('IoInfo', IO_COUNTERS),
+            ('ProcessMemoryLimit', ctypes.c_size_t),
+            ('JobMemoryLimit', ctypes.c_size_t),
+            ('PeakProcessMemoryUsed', ctypes.c_size_t),
+            ('PeakJobMemoryUsed', ctypes.c_size_t),
+        ]
+    
+    JobObjectExtendedLimitInformation = 9
+    JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+    
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.CreateJobObjectW.argtypes = [wintypes.LPVOID, wintypes.LPCWSTR]
+    kernel32.SetInformationJobObject.argtypes = [
+        wintypes.HANDLE, ctypes.c_int, wintypes.LPVOID, wintypes.DWORD
+    ]
+    kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    
+    PROCESS_TERMINATE = 0x0001
+    PROCESS_SET_QUOTA = 0x0100
+    
+    job = kernel32.CreateJobObjectW(None, None)
+    if not job:
+        return None
+    
+    process_handle = kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, pid)
+    if not process_handle:
+        logger.warning(f"Failed to open process {pid}: error {ctypes.get_last_error()}")
+        kernel32.CloseHandle(job)
+        return None
+    
+    info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+    try:
+        if not (kernel32.SetInformationJobObject(
+                    job, JobObjectExtendedLimitInformation,
+                    ctypes.byref(info), ctypes.sizeof(info))
+                and kernel32.AssignProcessToJobObject(job, process_handle)):
+            logger.warning(f"Failed to set up job object: error {ctypes.get_last_error()}")
+            kernel32.CloseHandle(job)
+            return None
+    finally:
+        kernel32.CloseHandle(process_handle)
+    
+    return job
+
+
+def _close_job(job: int):
+    """Close a job handle, terminating every process still in the job"""
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle(job)
+
 
 class MirrorEngine(QObject):
     """Screen mirroring engine using scrcpy"""
@@ -24,15 +126,19 @@ class MirrorEngine(QObject):
     def __init__(self):
         """Initialize Mirror Engine"""
         super().__init__()
-        self._process: Optional[asyncio.subprocess.Process] = None
+        self._process: Optional[QProcess] = None
         self._device: Optional[str] = None
         self._using_vbs = False  # Track if we launched via VBS (can't monitor process)
+        self._job: Optional[int] = None  # Windows job object holding the VBS-launched tree
+        self._alive = False  # Set on spawn, cleared as soon as exit is observed
         self.settings = QSettings('ADBManager', 'ADBManager')
-        
-        # Timer for monitoring process (avoids async conflicts with qasync)
-        self._monitor_timer = QTimer()
-        self._monitor_timer.timeout.connect(self._check_process_status)
-        self._monitor_timer.setInterval(200)  # Check every 200ms
+        self._scrcpy_path = self.settings.value('scrcpy_path', '')
+        self._cached_cmd: Optional[str] = None
+    
+    def invalidate_settings(self):
+        """Re-read settings after they were changed (e.g. in the Settings dialog)"""
+        self._scrcpy_path = self.settings.value('scrcpy_path', '')
+        self._cached_cmd = None
     
     def is_scrcpy_available(self) -> bool:
         """
@@ -41,13 +147,7 @@ class MirrorEngine(QObject):
         Returns:
             True if scrcpy is found, False otherwise
         """
-        custom_path = self.settings.value('scrcpy_path', '')
-        if custom_path:
-            scrcpy_exe = Path(custom_path) / 'scrcpy.exe'
-            if scrcpy_exe.exists():
-                return True
-        
-        return shutil.which('scrcpy') is not None
+        return self._resolve_scrcpy_command() is not None
     
     def _get_scrcpy_command(self) -> str:
         """
@@ -56,35 +156,48 @@ class MirrorEngine(QObject):
         Returns:
             Path to scrcpy executable (prefers scrcpy-noconsole.vbs on Windows)
         """
-        import sys
+        return self._resolve_scrcpy_command() or 'scrcpy'
+    
+    def _resolve_scrcpy_command(self) -> Optional[str]:
+        """
+        Locate the scrcpy executable, memoized until invalidate_settings()
+        
+        Misses are not cached, so installing scrcpy while the app runs is
+        still picked up.
+        
+        Returns:
+            Path to scrcpy executable, 'scrcpy' if found in PATH, or None
+        """
+        if self._cached_cmd is not None:
+            return self._cached_cmd
         
-        custom_path = self.settings.value('scrcpy_path', '')
-        logger.debug(f"scrcpy_path setting value: '{custom_path}'")
+        custom_path = self._scrcpy_path
+        
+        logger.debug("scrcpy_path setting value: '%s'", custom_path)
+        cmd = None
         
         if custom_path:
             custom_dir = Path(custom_path)
+            candidates = []
+            # On Windows, prefer scrcpy-noconsole.vbs (VBS wrapper hides ALL consoles),
+            # then the .exe variant
+            if _IS_WINDOWS:
+                candidates += ['scrcpy-noconsole.vbs', 'scrcpy-noconsole.exe']
+            candidates.append('scrcpy.exe')
             
-            # On Windows, prefer scrcpy-noconsole.vbs (VBS wrapper hides ALL consoles)
-            if sys.platform == 'win32':
-                # First try .vbs wrapper (best option - hides all console windows)
-                noconsole_vbs = custom_dir / 'scrcpy-noconsole.vbs'
-                if noconsole_vbs.exists():
-                    logger.info(f"Using scrcpy-noconsole.vbs: {noconsole_vbs}")
-                    return str(noconsole_vbs)
-                
-                # Fallback to .exe variant
-                noconsole_exe = custom_dir / 'scrcpy-noconsole.exe'
-                if noconsole_exe.exists():
-                    logger.info(f"Using scrcpy-noconsole.exe: {noconsole_exe}")
-                    return str(noconsole_exe)
-            
-            scrcpy_exe = custom_dir / 'scrcpy.exe'
-            if scrcpy_exe.exists():
-                logger.info(f"Using scrcpy.exe: {scrcpy_exe}")
-                return str(scrcpy_exe)
+            for name in candidates:
+                candidate = custom_dir / name
+                if candidate.exists():
+                    logger.info(f"Using {name}: {candidate}")
+                    cmd = str(candidate)
+                    break
+        
+        if cmd is None and shutil.which('scrcpy') is not None:
+            logger.info("Falling back to 'scrcpy' from PATH")
+            cmd = 'scrcpy'
         
-        logger.info("Falling back to 'scrcpy' from PATH")
-        return 'scrcpy'
+        self._cached_cmd = cmd
+        return cmd
     
     async def start_mirror(self, device: str, options: Optional[Dict] = None) -> bool:
         """
@@ -104,28 +217,55 @@ class MirrorEngine(QObject):
         """
         # In VBS mode, we can't track the actual scrcpy process
         # Check if we think we're currently mirroring
-        if self._process and not self._using_vbs:
+        if self._alive and not self._using_vbs:
             # Only block if we have a real process handle (not VBS mode)
-            if self._process.returncode is None:
-                logger.warning("Mirroring already active")
-                return False
-            else:
-                # Process has exited, clean up
-                self._process = None
+            logger.warning("Mirroring already active")
+            return False
         
         # Also check _using_vbs flag - if set but process is gone, reset it
         if self._using_vbs and self._process is None:
             self._using_vbs = False
         
-        if not self.is_scrcpy_available():
+        scrcpy_cmd = self._resolve_scrcpy_command()
+        if scrcpy_cmd is None:
             error_msg = "scrcpy not found. Please install scrcpy and add it to PATH."
             logger.error(error_msg)
             self.error_occurred.emit(error_msg)
             return False
         
-        scrcpy_cmd = self._get_scrcpy_command()
+        scrcpy_args = self._build_args(device, options)
         
-        # Build scrcpy arguments
+        try:
+            # VBS launches wscript which exits immediately - we can't monitor scrcpy itself
+            self._using_vbs = scrcpy_cmd.endswith('.vbs')
+            spawner = self._spawn_vbs if self._using_vbs else self._spawn_exec
+            self._process = await spawner(scrcpy_cmd, scrcpy_args)
+            
+            self._device = device
+            self._alive = True
+            self.mirror_started.emit()
+            logger.info(f"Screen mirroring started for {device}")
+            
+            return True
+            
+        except Exception as e:
+            error_msg = f"Failed to start mirroring: {str(e)}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return False
+    
+    @staticmethod
+    def _build_args(device: str, options: Optional[Dict]) -> List[str]:
+        """
+        Build scrcpy command-line arguments
+        
+        Args:
+            device: Device serial number
+            options: Mirroring options (see start_mirror)
+            
+        Returns:
+            Argument list
+        """
         scrcpy_args = ['-s', device]
         
         if options:
@@ -144,71 +284,106 @@ class MirrorEngine(QObject):
             if options.get('fullscreen', False):
                 scrcpy_args.append('--fullscreen')
         
+        return scrcpy_args
+    
+    async def _spawn_vbs(self, scrcpy_cmd: str, scrcpy_args: List[str]) -> Optional[QProcess]:
+        """
+        Launch scrcpy through its noconsole VBS wrapper
+        
+        The VBS file runs "cmd /c scrcpy.exe" from its directory, so the working
+        directory must be the scrcpy directory for it to find scrcpy.exe.
+        
+        Returns:
+            The wscript process, or None where VBS can't run
+        """
+        scrcpy_dir = str(Path(scrcpy_cmd).parent)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting scrcpy via VBS: wscript.exe %s %s (cwd: %s)",
+                        scrcpy_cmd, ' '.join(scrcpy_args), scrcpy_dir)
+        
+        if not _IS_WINDOWS:
+            return None
+        
+        # QProcess reports state through signals, avoiding the asyncio subprocess
+        # transports that can hang under qasync on Windows
+        process = QProcess(self)
+        process.setProgram('wscript.exe')
+        process.setArguments([scrcpy_cmd] + scrcpy_args)
+        process.setWorkingDirectory(scrcpy_dir)
+        # scrcpy is started by wscript, which inherits this job, so
+        # stopping can kill exactly this tree. started() is emitted
+        # straight from CreateProcess, before wscript gets going.
+        process.started.connect(lambda: self._assign_job(process))
+        if not await start_process(process):
+            raise RuntimeError(process.errorString())
+        return process
+    
+    async def _spawn_exec(self, scrcpy_cmd: str, scrcpy_args: List[str]) -> QProcess:
+        """
+        Launch the scrcpy executable directly so its exit can be observed
+        
+        Returns:
+            The scrcpy process
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting scrcpy: %s %s", scrcpy_cmd, ' '.join(scrcpy_args))
+        
+        # Qt already spawns console programs with CREATE_NO_WINDOW from a GUI app
+        process = QProcess(self)
+        process.setProgram(scrcpy_cmd)
+        process.setArguments(scrcpy_args)
+        # Nothing reads scrcpy's verbose output, so discard it rather
+        # than let it fill a pipe
+        process.setStandardInputFile(QProcess.nullDevice())
+        process.setStandardOutputFile(QProcess.nullDevice())
+        process.setStandardErrorFile(QProcess.nullDevice())
+        self._isolate_session(process)
+        process.finished.connect(
+            lambda exit_code, exit_status: self._on_process_finished(process, exit_code, exit_status)
+        )
+        if not await start_process(process):
+            raise RuntimeError(process.errorString())
+        return process
+    
+    @staticmethod
+    def _isolate_session(process: QProcess):
+        """
+        Start scrcpy in its own session on POSIX
+        
+        Keeps terminal signals (e.g. Ctrl+C in the launching shell) from
+        reaching scrcpy, so only stop_mirror decides when it ends. Needs
+        Qt 6.7; older versions keep the default. On Windows Qt already starts
+        it with CREATE_NO_WINDOW, detached from any console.
+        """
+        flag = getattr(getattr(QProcess, 'UnixProcessFlag', None), 'CreateNewSession', None)
+        if _IS_WINDOWS or flag is None:
+            return
+        process.setUnixProcessParameters(flag)
+    
+    def _assign_job(self, process: QProcess):
+        """Put a freshly started VBS launcher into a kill-on-close job"""
         try:
-            import sys
-            import subprocess
-            
-            # Check if we're using a VBS wrapper
-            if scrcpy_cmd.endswith('.vbs'):
-                # VBS wrapper: The VBS file runs "cmd /c scrcpy.exe" from its directory
-                # We need to set cwd to the scrcpy directory so it can find scrcpy.exe
-                # NOTE: wscript.exe exits immediately after spawning scrcpy, so we can't monitor the process
-                self._using_vbs = True
-                scrcpy_dir = str(Path(scrcpy_cmd).parent)
-                cmd_line = f'wscript.exe "{scrcpy_cmd}" {" ".join(scrcpy_args)}'
-                logger.info(f"Starting scrcpy via VBS: {cmd_line} (cwd: {scrcpy_dir})")
-                
-                if sys.platform == 'win32':
-                    # Use shell execution for VBS with correct working directory
-                    self._process = await asyncio.create_subprocess_shell(
-                        cmd_line,
-                        cwd=scrcpy_dir,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-            else:
-                # Regular executable - we can monitor this process
-                self._using_vbs = False
-                cmd = [scrcpy_cmd] + scrcpy_args
-                logger.info(f"Starting scrcpy: {' '.join(cmd)}")
-                
-                kwargs = {}
-                if sys.platform == 'win32':
-                    kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
-                
-                self._process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    **kwargs
-                )
-            
-            self._device = device
-            self.mirror_started.emit()
-            logger.info(f"Screen mirroring started for {device}")
-            
-            # Only start monitor timer if we can actually track the process
-            # VBS launches wscript which exits immediately - we can't monitor scrcpy itself
-            if not self._using_vbs:
-                self._monitor_timer.start()
-            
-            return True
-            
+            self._job = _create_kill_on_close_job(process.processId())
         except Exception as e:
-            error_msg = f"Failed to start mirroring: {str(e)}"
-            logger.error(error_msg)
-            self.error_occurred.emit(error_msg)
-            return False
+            logger.warning(f"Could not create job object for scrcpy: {e}")
+            self._job = None
     
     async def stop_mirror(self):
         """Stop screen mirroring"""
         if not self._process and not self._using_vbs:
             return
         
-        self._monitor_timer.stop()
-        
         # If using VBS mode, we can't terminate via process handle
-        # because wscript.exe has already exited. Use taskkill to find and kill scrcpy.exe
+        # because wscript.exe has already exited. Closing the job kills the
+        # scrcpy tree we started; taskkill is only the fallback without a job
         if self._using_vbs:
             try:
-                import subprocess
+                if self._job is not None:
+                    _close_job(self._job)
+                    self._job = None
+                    logger.info("scrcpy job terminated successfully")
+                    return
+                
                 # Use taskkill to terminate scrcpy.exe (only for this device session)
                 # /F = Force, /IM = Image name
                 result = subprocess.run(
@@ -226,45 +401,45 @@ class MirrorEngine(QObject):
             finally:
                 self._process = None
                 self._device = None
+                self._alive = False
                 self._using_vbs = False
                 self.mirror_stopped.emit()
                 logger.info("Screen mirroring stopped (VBS mode)")
             return
         
+        # Detach first so the finished signal is not reported as an unexpected exit
+        process = self._process
+        self._process = None
         try:
-            self._process.terminate()
-            await asyncio.wait_for(self._process.wait(), timeout=5.0)
-        except asyncio.TimeoutError:
-            self._process.kill()
-            await self._process.wait()
+            # On Windows terminate() posts WM_CLOSE, which scrcpy handles as a clean quit
+            process.terminate()
+            if not await wait_for_process_exit(process, timeout=5.0):
+                process.kill()
+                await wait_for_process_exit(process, timeout=5.0)
         except Exception as e:
             logger.error(f"Error stopping mirroring: {e}")
         finally:
-            self._process = None
+            process.deleteLater()
             self._device = None
+            self._alive = False
             self.mirror_stopped.emit()
             logger.info("Screen mirroring stopped")
     
-    def _check_process_status(self):
-        """
-        Timer callback: Check if scrcpy process is still running.
-        Uses QTimer instead of async loop to avoid qasync conflicts.
-        """
-        if not self._process:
-            self._monitor_timer.stop()
-            return
+    def _on_process_finished(self, process: QProcess, exit_code: int, exit_status: QProcess.ExitStatus):
+        """Report that the scrcpy process has exited on its own"""
+        if self._process is not process:
+            return  # Stopped deliberately, or superseded by a newer session
         
-        if self._process.returncode is not None:
-            self._monitor_timer.stop()
-            
-            if self._process.returncode != 0:
-                logger.error(f"scrcpy exited with code: {self._process.returncode}")
-                self.error_occurred.emit("Screen mirroring ended unexpectedly")
-            
-            self._process = None
-            self._device = None
-            self.mirror_stopped.emit()
-            logger.info("Screen mirroring stopped")
+        if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
+            logger.error(f"scrcpy exited with code: {exit_code}")
+            self.error_occurred.emit("Screen mirroring ended unexpectedly")
+        
+        self._process = None
+        self._device = None
+        self._alive = False
+        process.deleteLater()
+        self.mirror_stopped.emit()
+        logger.info("Screen mirroring stopped")
     
     async def take_screenshot(self, output_path: Path) -> bool:
         """
@@ -318,7 +493,7 @@ class MirrorEngine(QObject):
     @property
     def is_mirroring(self) -> bool:
         """Check if mirroring is active"""
-        return self._process is not None
+        return self._alive
     
     @property
     def current_device(self) -> Optional[str]:
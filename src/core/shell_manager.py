@@ -5,12 +5,15 @@ This module handles interactive ADB shell sessions with command execution,
 output streaming, and history tracking.
 """
 
-import asyncio
+import codecs
 import logging
+import secrets
+from collections import deque
 from typing import Optional, List
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer, QProcess
 
 from utils.adb_wrapper import ADBWrapper
+from utils.async_helper import start_process, wait_for_process_exit
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +23,22 @@ class ShellManager(QObject):
     Manages interactive ADB shell sessions
     
     Signals:
-        output_received: Emitted when output is received (output: str, is_error: bool)
+        output_received: Emitted with coalesced output, at most once per frame per stream (output: str, is_error: bool)
+        command_finished: Emitted once a command's stdout and stderr have both been delivered
         shell_started: Emitted when shell session starts
         shell_stopped: Emitted when shell session stops
         shell_error: Emitted on shell errors (error_message: str)
     """
     
     output_received = Signal(str, bool)  # (output, is_error)
+    command_finished = Signal()
     shell_started = Signal()
     shell_stopped = Signal()
     shell_error = Signal(str)
     
+    FLUSH_INTERVAL_MS = 16  # about one frame
+    HISTORY_SIZE = 1000
+    
     def __init__(self, adb: ADBWrapper):
         """
         Initialize Shell Manager
@@ -41,11 +49,26 @@ class ShellManager(QObject):
         super().__init__()
         self.adb = adb
         self._active = False
-        self._process: Optional[asyncio.subprocess.Process] = None
-        self._read_task: Optional[asyncio.Task] = None
+        self._process: Optional[QProcess] = None
         self._current_device: Optional[str] = None
-        self._command_history: List[str] = []
+        self._command_history: deque[str] = deque(maxlen=self.HISTORY_SIZE)
         self._history_index = -1
+        
+        # Output is buffered per stream (keyed by is_error) and emitted in one
+        # signal per frame rather than one per read
+        self._pending = {False: [], True: []}
+        self._decoders = {}
+        
+        # A piped adb shell prints no prompt, so each command is followed by an
+        # echo of this marker on both streams to tell when its output is complete
+        self._end_marker = f"__ADBM_END_{secrets.token_hex(8)}__"
+        self._marker_tail = {False: '', True: ''}
+        self._marker_seen = {False: False, True: False}
+        self._held = {False: [], True: []}
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_output)
         logger.info("Shell Manager initialized")
     
     async def start_shell(self, device: str):
@@ -62,34 +85,33 @@ class ShellManager(QObject):
         try:
             self._current_device = device
             
-            cmd = [str(self.adb.adb_path), "-s", device, "shell"]
-            
             logger.info(f"Starting shell session for device {device}")
             
-            # Prepare subprocess args
-            kwargs = {
-                'stdin': asyncio.subprocess.PIPE,
-                'stdout': asyncio.subprocess.PIPE,
-                'stderr': asyncio.subprocess.PIPE
+            # QProcess reports output and exit through Qt signals, avoiding the
+            # asyncio pipe transports that can hang under qasync on Windows.
+            # Qt already spawns console programs with CREATE_NO_WINDOW from a GUI app.
+            process = QProcess(self)
+            process.setProgram(str(self.adb.adb_path))
+            process.setArguments(["-s", device, "shell"])
+            process.readyReadStandardOutput.connect(self._on_stdout)
+            process.readyReadStandardError.connect(self._on_stderr)
+            process.finished.connect(self._on_finished)
+            
+            # Incremental decoding keeps multi-byte characters split across reads intact
+            self._decoders = {
+                False: codecs.getincrementaldecoder('utf-8')(errors='replace'),
+                True: codecs.getincrementaldecoder('utf-8')(errors='replace'),
             }
+            self._marker_tail = {False: '', True: ''}
+            self._marker_seen = {False: False, True: False}
+            self._held = {False: [], True: []}
+            self._process = process
             
-            import sys
-            import subprocess
-            if sys.platform == 'win32':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                kwargs['startupinfo'] = startupinfo
-
-            self._process = await asyncio.create_subprocess_exec(
-                *cmd,
-                **kwargs
-            )
+            if not await start_process(process):
+                raise RuntimeError(process.errorString())
             
             self._active = True
             
-            self._read_task = asyncio.ensure_future(self._read_output())
-            
             self.shell_started.emit()
             logger.info("Shell session started")
             
@@ -98,55 +120,122 @@ class ShellManager(QObject):
             logger.error(error_msg)
             self.shell_error.emit(error_msg)
             self._active = False
+            self._process = None
     
-    async def _read_output(self):
-        """Read and emit shell output"""
-        try:
-            while self._active and self._process:
-                if self._process.stdout:
-                    try:
-                        # Use wait_for with timeout to avoid blocking forever
-                        line = await asyncio.wait_for(
-                            self._process.stdout.readline(),
-                            timeout=0.1
-                        )
-                        if line:
-                            output = line.decode('utf-8', errors='replace')
-                            self.output_received.emit(output, False)
-                    except asyncio.TimeoutError:
-                        pass
-                
-                if self._process.stderr:
-                    try:
-                        line = await asyncio.wait_for(
-                            self._process.stderr.readline(),
-                            timeout=0.1
-                        )
-                        if line:
-                            output = line.decode('utf-8', errors='replace')
-                            self.output_received.emit(output, True)
-                    except asyncio.TimeoutError:
-                        pass
-                
-                await asyncio.sleep(0.01)
-        
-        except asyncio.CancelledError:
-            logger.debug("Shell read task cancelled")
-        except Exception as e:
-            logger.error(f"Error reading shell output: {e}")
-        finally:
-            if self._active:
-                self._active = False
-                self.shell_stopped.emit()
+    def _on_stdout(self):
+        """Buffer newly available stdout"""
+        if self._process:
+            self._buffer_output(self._process.readAllStandardOutput().data(), False)
+    
+    def _on_stderr(self):
+        """Buffer newly available stderr"""
+        if self._process:
+            self._buffer_output(self._process.readAllStandardError().data(), True)
+    
+    def _buffer_output(self, chunk: bytes, is_error: bool):
+        """
+        Decode output from one stream and schedule it for emission
+        
+        Args:
+            chunk: Raw bytes read from the stream (empty at end of stream)
+            is_error: Whether the stream is stderr
+        """
+        decoder = self._decoders[is_error]
+        if chunk.isascii() and not decoder.getstate()[0]:
+            # Typical adb output: skip the codec machinery entirely
+            text = chunk.decode('ascii')
+        else:
+            text = decoder.decode(chunk, final=not chunk)
+        self._queue_text(text, is_error, final=not chunk)
+    
+    def _queue_text(self, text: str, is_error: bool, final: bool = False):
+        """
+        Buffer decoded text from one stream, splitting it at end-of-command markers
+        
+        Output before a marker is flushed and command_finished emitted once that
+        command's marker has arrived on both streams. Text that arrives on a
+        stream after its marker belongs to the next command, so it is held back
+        until then to keep the prompt between the two commands' output.
+        
+        Args:
+            text: Newly decoded text
+            is_error: Whether the stream is stderr
+            final: True at end of stream (nothing is held back)
+        """
+        if final:
+            # The other stream's marker will never come; release everything as is
+            text = self._marker_tail[is_error] + ''.join(self._held[is_error]) + text
+            self._marker_tail[is_error] = ''
+            self._held[is_error].clear()
+            self._marker_seen[is_error] = False
+        elif self._marker_seen[is_error]:
+            self._held[is_error].append(text)
+            return
+        else:
+            text = self._marker_tail[is_error] + text
+            self._marker_tail[is_error] = ''
+            token = self._end_marker + '\n'
+            index = text.find(token)
+            if index >= 0:
+                text, rest = text[:index], text[index + len(token):]
+                self._marker_seen[is_error] = True
+                if rest:
+                    self._held[is_error].append(rest)
+            else:
+                # Hold back a trailing partial marker until the next read completes it
+                for size in range(min(len(token) - 1, len(text)), 0, -1):
+                    if token.startswith(text[-size:]):
+                        self._marker_tail[is_error] = text[-size:]
+                        text = text[:-size]
+                        break
+        
+        if text:
+            self._pending[is_error].append(text)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+        
+        if self._marker_seen[False] and self._marker_seen[True]:
+            self._marker_seen = {False: False, True: False}
+            self._flush_output()
+            self.command_finished.emit()
+            for stream, held in self._held.items():
+                if held:
+                    rest = ''.join(held)
+                    held.clear()
+                    self._queue_text(rest, stream)
+    
+    def _on_finished(self, exit_code: int, exit_status: QProcess.ExitStatus):
+        """Handle the adb shell process exiting"""
+        self._on_stdout()
+        self._on_stderr()
+        for is_error in self._decoders:
+            self._buffer_output(b'', is_error)
+        self._flush_output()
+        
+        if self._active:
+            logger.info(f"Shell process exited with code {exit_code}")
+            self._active = False
+            self.shell_stopped.emit()
+    
+    def _flush_output(self):
+        """Emit buffered output, one signal per stream"""
+        self._flush_timer.stop()
+        for is_error, parts in self._pending.items():
+            if parts:
+                output = ''.join(parts)
+                parts.clear()
+                self.output_received.emit(output, is_error)
     
     async def execute_command(self, command: str):
         """
         Execute command in shell
         
+        command_finished is emitted once the command's output has been delivered.
+        
         Args:
             command: Command to execute
         """
-        if not self._active or not self._process or not self._process.stdin:
+        if not self._active or not self._process:
             logger.warning("Shell not active")
             return
         
@@ -155,10 +244,12 @@ class ShellManager(QObject):
                 self._command_history.append(command)
             self._history_index = len(self._command_history)
             
-            self._process.stdin.write((command + '\n').encode('utf-8'))
-            await self._process.stdin.drain()
+            marker = self._end_marker
+            line = f"{command}\necho {marker}; echo {marker} >&2\n"
+            if self._process.write(line.encode('utf-8')) < 0:
+                raise RuntimeError(self._process.errorString())
             
-            logger.debug(f"Executed command: {command}")
+            logger.debug("Executed command: %s", command)
             
         except Exception as e:
             error_msg = f"Failed to execute command: {e}"
@@ -173,23 +264,18 @@ class ShellManager(QObject):
         logger.info("Stopping shell session")
         self._active = False
         
-        if self._read_task:
-            self._read_task.cancel()
-            try:
-                await self._read_task
-            except asyncio.CancelledError:
-                pass
-            self._read_task = None
-        
         if self._process:
-            if self._process.returncode is None:
-                self._process.terminate()
-                try:
-                    await asyncio.wait_for(self._process.wait(), timeout=2.0)
-                except asyncio.TimeoutError:
-                    self._process.kill()
-                    await self._process.wait()
+            process = self._process
             self._process = None
+            if process.state() != QProcess.ProcessState.NotRunning:
+                # Closing stdin ends the remote shell; terminate/kill are fallbacks
+                process.closeWriteChannel()
+                process.terminate()
+                if not await wait_for_process_exit(process, timeout=2.0):
+                    process.kill()
+                    await wait_for_process_exit(process, timeout=2.0)
+            self._flush_output()
+            process.deleteLater()
         
         self.shell_stopped.emit()
         logger.info("Shell session stopped")
@@ -201,7 +287,7 @@ class ShellManager(QObject):
         Returns:
             List of previous commands
         """
-        return self._command_history.copy()
+        return list(self._command_history)
     
     def get_history_prev(self) -> Optional[str]:
         """
@@ -7,33 +7,111 @@ Provides UI for wireless ADB pairing and connection with multiple methods:
 3. QR Display - Generate QR code for phone to scan (mDNS-based)
 """
 
+import importlib
 import logging
 import re
-import io
 import asyncio
 import secrets
-import threading
 import socket
+import subprocess
+import time
+from ipaddress import IPv4Address
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QPushButton, QCheckBox, QLabel,
     QMessageBox, QGroupBox, QTabWidget, QWidget,
-    QFileDialog, QFrame
+    QFileDialog, QFrame, QApplication, QSpinBox
 )
-from PySide6.QtCore import Qt, Slot, QTimer, Signal
-from PySide6.QtGui import QIntValidator, QPixmap, QImage, QClipboard
+from PySide6.QtCore import (
+    Qt, Slot, QTimer, Signal, QObject, QRunnable, QThreadPool, QMetaObject, Q_ARG,
+    QRegularExpression
+)
+from PySide6.QtGui import QRegularExpressionValidator, QPixmap, QImage, QClipboard
 
 from utils.async_helper import safe_ensure_future
 
 logger = logging.getLogger(__name__)
 
+# Screenshots larger than this on either side are scanned downscaled first
+_QR_DOWNSCALE_THRESHOLD = 1500
+_QR_SCAN_MAX_DIM = 1200
+
+# Seconds a detected local IP address is reused before probing again
+_LOCAL_IP_TTL = 5.0
+
+# Dotted-quad IPv4 address; each octet limited to 0-255 by the pattern itself
+_IP_RE = re.compile(r'^(?:(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d?\d)$')
+
+# Pairing data formats: IP:PORT inside a WIFI: service field, or plain IP:PORT:CODE
+_QR_SERVICE_IP_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+):(\d+)')
+_QR_PLAIN_RE = re.compile(r'^(\d+\.\d+\.\d+\.\d+):(\d+):(\d{6})$')
+
+
+def _preload_optional_modules():
+    """Import the QR and mDNS libraries ahead of first use (runs on the thread pool)"""
+    for name in ('qrcode', 'pyzbar.pyzbar', 'zeroconf'):
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            # Reported to the user by the feature that needs it, if they use it
+            logger.debug(f"Optional module {name} unavailable: {e}")
+
+
+class _TaskSignals(QObject):
+    """Signals for delivering a thread pool result back to the GUI thread"""
+    
+    finished = Signal(object)  # Return value
+    failed = Signal(object)  # Exception raised
+
+
+class _PoolTask(QRunnable):
+    """Runs image work on the thread pool so it doesn't freeze the dialog"""
+    
+    def __init__(self, signals: _TaskSignals, fn: Callable, *args):
+        """
+        Initialize pool task
+        
+        Args:
+            signals: Signals to report the result through
+            fn: Callable to run; must not touch widgets or QPixmap
+            *args: Arguments for fn
+        """
+        super().__init__()
+        self._signals = signals
+        self._fn = fn
+        self._args = args
+    
+    def run(self):
+        """Call the function and emit its result"""
+        try:
+            self._signals.finished.emit(self._fn(*self._args))
+        except Exception as e:
+            self._signals.failed.emit(e)
+
+
+def _release_mdns(zeroconf, info, browser):
+    """Cancel a pairing browser, withdraw its service and close the Zeroconf instance"""
+    try:
+        if browser is not None:
+            browser.cancel()
+        zeroconf.unregister_service(info)
+        zeroconf.close()
+    except Exception as e:
+        logger.error(f"Error releasing mDNS service: {e}")
+
 
 class WirelessDialog(QDialog):
     """Dialog for wireless ADB connection with multiple pairing methods"""
     
+    # Manual connect button labels ('&&' renders a literal ampersand)
+    _TXT_CONNECT = "Connect"
+    _TXT_PAIR = "Pair && Connect"
+    _TXT_CONNECTING = "Connecting..."
+    _TXT_PAIRING = "Pairing..."
+    
     def __init__(self, device_manager, parent=None):
         """
         Initialize Wireless Connection Dialog
@@ -45,7 +123,21 @@ class WirelessDialog(QDialog):
         super().__init__(parent)
         self.device_manager = device_manager
         self._mdns_service = None
+        self._mdns_browser = None
+        self._zeroconf = None  # Created on first use, reused until the dialog closes
+        self._zeroconf_ip: Optional[str] = None
+        # Bumped by every stop, so pool results from an older Generate are discarded
+        self._mdns_generation = 0
+        self._msg_box: Optional[QMessageBox] = None  # Reused across manual connect attempts
+        self._cached_ip: Optional[str] = None
+        self._cached_ip_ts = 0.0
         self._setup_ui()
+        
+        # Warm the import cache so the first Generate/Load click doesn't wait on disk
+        self._preload_signals = _TaskSignals()
+        QThreadPool.globalInstance().start(
+            _PoolTask(self._preload_signals, _preload_optional_modules)
+        )
     
     def _setup_ui(self):
         """Setup user interface"""
@@ -103,8 +195,9 @@ class WirelessDialog(QDialog):
         self.ip_input.setPlaceholderText("192.168.1.100")
         conn_layout.addRow("IP Address:", self.ip_input)
         
-        self.port_input = QLineEdit("5555")
-        self.port_input.setValidator(QIntValidator(1, 65535))
+        self.port_input = QSpinBox()
+        self.port_input.setRange(1, 65535)
+        self.port_input.setValue(5555)
         conn_layout.addRow("Connection Port:", self.port_input)
         
         layout.addWidget(conn_group)
@@ -120,18 +213,22 @@ class WirelessDialog(QDialog):
         self.pair_code_input = QLineEdit()
         self.pair_code_input.setPlaceholderText("123456")
         self.pair_code_input.setMaxLength(6)
+        self.pair_code_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"\d{0,6}"), self.pair_code_input)
+        )
         pair_layout.addRow("Pairing Code:", self.pair_code_input)
         
-        self.pair_port_input = QLineEdit()
-        self.pair_port_input.setPlaceholderText("37171")
-        self.pair_port_input.setValidator(QIntValidator(1, 65535))
+        # The pairing port changes every time, so 0 stands for "not entered yet"
+        self.pair_port_input = QSpinBox()
+        self.pair_port_input.setRange(0, 65535)
+        self.pair_port_input.setSpecialValueText(" ")
         pair_layout.addRow("Pairing Port:", self.pair_port_input)
         
         self.pair_group.setVisible(False)
         layout.addWidget(self.pair_group)
         
         # Connect button
-        self.manual_connect_btn = QPushButton("Connect")
+        self.manual_connect_btn = QPushButton(self._TXT_CONNECT)
         self.manual_connect_btn.setDefault(True)
         self.manual_connect_btn.clicked.connect(self._on_manual_connect)
         layout.addWidget(self.manual_connect_btn)
@@ -165,13 +262,13 @@ class WirelessDialog(QDialog):
         # Buttons
         btn_layout = QHBoxLayout()
         
-        paste_btn = QPushButton("Paste from Clipboard")
-        paste_btn.clicked.connect(self._paste_qr)
-        btn_layout.addWidget(paste_btn)
+        self.qr_paste_btn = QPushButton("Paste from Clipboard")
+        self.qr_paste_btn.clicked.connect(self._paste_qr)
+        btn_layout.addWidget(self.qr_paste_btn)
         
-        load_btn = QPushButton("Load Image...")
-        load_btn.clicked.connect(self._load_qr_image)
-        btn_layout.addWidget(load_btn)
+        self.qr_load_btn = QPushButton("Load Image...")
+        self.qr_load_btn.clicked.connect(self._load_qr_image)
+        btn_layout.addWidget(self.qr_load_btn)
         
         layout.addLayout(btn_layout)
         
@@ -257,7 +354,30 @@ class WirelessDialog(QDialog):
     def _toggle_pairing(self, checked):
         """Toggle pairing group visibility"""
         self.pair_group.setVisible(checked)
-        self.manual_connect_btn.setText("Pair && Connect" if checked else "Connect")
+        self.manual_connect_btn.setText(self._TXT_PAIR if checked else self._TXT_CONNECT)
+    
+    def _reset_connect_btn(self):
+        """Re-enable the manual connect button with its idle label"""
+        self.manual_connect_btn.setEnabled(True)
+        self.manual_connect_btn.setText(
+            self._TXT_PAIR if self.pair_checkbox.isChecked() else self._TXT_CONNECT
+        )
+    
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """
+        Show a modal message, reusing one QMessageBox instead of building a new one per call
+        
+        Args:
+            icon: Message box icon
+            title: Window title
+            text: Message text
+        """
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setIcon(icon)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(text)
+        self._msg_box.exec()
     
     @Slot()
     def _on_manual_connect(self):
@@ -266,98 +386,69 @@ class WirelessDialog(QDialog):
     
     def _validate_ip(self, ip: str) -> bool:
         """Validate IP address format"""
-        pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        if not re.match(pattern, ip):
-            return False
-        octets = ip.split('.')
-        return all(0 <= int(octet) <= 255 for octet in octets)
+        return _IP_RE.fullmatch(ip) is not None
     
     async def _manual_connect(self):
         """Perform manual wireless connection"""
         ip = self.ip_input.text().strip()
-        port = self.port_input.text().strip()
+        port_num = self.port_input.value()
         
         if not ip:
-            QMessageBox.warning(self, "Invalid Input", "Please enter an IP address.")
+            self._show_message(QMessageBox.Icon.Warning, "Invalid Input", "Please enter an IP address.")
             return
         
         if not self._validate_ip(ip):
-            QMessageBox.warning(self, "Invalid IP", "Please enter a valid IP address.")
-            return
-        
-        if not port:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a port number.")
-            return
-        
-        try:
-            port_num = int(port)
-            if port_num < 1 or port_num > 65535:
-                raise ValueError()
-        except ValueError:
-            QMessageBox.warning(self, "Invalid Port", "Port must be between 1 and 65535.")
+            self._show_message(QMessageBox.Icon.Warning, "Invalid IP", "Please enter a valid IP address.")
             return
         
         # Handle pairing if enabled
         if self.pair_checkbox.isChecked():
             pair_code = self.pair_code_input.text().strip()
-            pair_port = self.pair_port_input.text().strip()
+            pair_port_num = self.pair_port_input.value()
             
             if not pair_code or len(pair_code) != 6:
-                QMessageBox.warning(self, "Invalid Pairing Code", "Pairing code must be 6 digits.")
+                self._show_message(QMessageBox.Icon.Warning, "Invalid Pairing Code", "Pairing code must be 6 digits.")
                 return
             
-            if not pair_port:
-                QMessageBox.warning(self, "Invalid Input", "Please enter a pairing port.")
-                return
-            
-            try:
-                pair_port_num = int(pair_port)
-                if pair_port_num < 1 or pair_port_num > 65535:
-                    raise ValueError()
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Port", "Pairing port must be between 1 and 65535.")
+            if not pair_port_num:
+                self._show_message(QMessageBox.Icon.Warning, "Invalid Input", "Please enter a pairing port.")
                 return
             
             self.manual_connect_btn.setEnabled(False)
-            self.manual_connect_btn.setText("Pairing...")
+            self.manual_connect_btn.setText(self._TXT_PAIRING)
             
             try:
                 success = await self.device_manager.pair_wireless(ip, pair_port_num, pair_code)
                 if not success:
-                    QMessageBox.critical(self, "Pairing Failed", "Failed to pair. Check the code and try again.")
-                    self.manual_connect_btn.setEnabled(True)
-                    self.manual_connect_btn.setText("Pair && Connect")
+                    self._show_message(QMessageBox.Icon.Critical, "Pairing Failed", "Failed to pair. Check the code and try again.")
+                    self._reset_connect_btn()
                     return
             except Exception as e:
                 logger.error(f"Pairing error: {e}")
-                QMessageBox.critical(self, "Pairing Error", f"Error during pairing: {str(e)}")
-                self.manual_connect_btn.setEnabled(True)
-                self.manual_connect_btn.setText("Pair && Connect")
+                self._show_message(QMessageBox.Icon.Critical, "Pairing Error", f"Error during pairing: {str(e)}")
+                self._reset_connect_btn()
                 return
         
         # Connect
-        self.manual_connect_btn.setText("Connecting...")
+        self.manual_connect_btn.setText(self._TXT_CONNECTING)
         self.manual_connect_btn.setEnabled(False)
         
         try:
             device = await self.device_manager.connect_wireless(ip, port_num)
             if device:
-                QMessageBox.information(self, "Success", f"Connected to {device.serial}")
+                self._show_message(QMessageBox.Icon.Information, "Success", f"Connected to {device.serial}")
                 self.accept()
             else:
-                QMessageBox.critical(self, "Connection Failed", "Failed to connect. Ensure wireless debugging is enabled.")
-                self.manual_connect_btn.setEnabled(True)
-                self.manual_connect_btn.setText("Connect")
+                self._show_message(QMessageBox.Icon.Critical, "Connection Failed", "Failed to connect. Ensure wireless debugging is enabled.")
+                self._reset_connect_btn()
         except Exception as e:
             logger.error(f"Connection error: {e}")
-            QMessageBox.critical(self, "Connection Error", f"Error: {str(e)}")
-            self.manual_connect_btn.setEnabled(True)
-            self.manual_connect_btn.setText("Connect")
+            self._show_message(QMessageBox.Icon.Critical, "Connection Error", f"Error: {str(e)}")
+            self._reset_connect_btn()
     
     @Slot()
     def _paste_qr(self):
         """Paste QR image from clipboard"""
-        from PySide6.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         image = clipboard.image()
         
@@ -384,56 +475,138 @@ class WirelessDialog(QDialog):
             self._process_qr_image(image)
     
     def _process_qr_image(self, image: QImage):
-        """Process QR code image and extract pairing info"""
-        try:
-            from pyzbar.pyzbar import decode
-            from PIL import Image
-            
-            # Convert QImage to PIL Image
-            buffer = image.bits().tobytes()
-            pil_image = Image.frombytes(
-                'RGBA' if image.hasAlphaChannel() else 'RGB',
-                (image.width(), image.height()),
-                buffer
-            )
-            
-            # Decode QR codes
-            decoded = decode(pil_image)
-            
-            if not decoded:
-                self.qr_preview_label.setText("No QR code detected in image")
-                self.qr_info_label.setText("")
-                self.qr_connect_btn.setEnabled(False)
-                return
+        """Decode a QR code image on the thread pool and extract pairing info"""
+        self._set_qr_input_enabled(False)
+        self.qr_preview_label.setText("Scanning for QR code...")
+        self.qr_info_label.setText("")
+        self.qr_connect_btn.setEnabled(False)
+        
+        # Keep the signals object alive until the result has been delivered
+        self._qr_task_signals = _TaskSignals()
+        self._qr_task_signals.finished.connect(
+            lambda decoded: self._on_qr_decoded(image, decoded)
+        )
+        self._qr_task_signals.failed.connect(self._on_qr_decode_failed)
+        # QImage (unlike QPixmap) is safe to use off the GUI thread
+        QThreadPool.globalInstance().start(
+            _PoolTask(self._qr_task_signals, self._decode_qr, image)
+        )
+    
+    def _set_qr_input_enabled(self, enabled: bool):
+        """Enable or disable the QR image inputs while a decode is pending"""
+        self.qr_paste_btn.setEnabled(enabled)
+        self.qr_load_btn.setEnabled(enabled)
+    
+    def _on_qr_decoded(self, image: QImage, decoded: list):
+        """Show the result of a background QR decode"""
+        self._set_qr_input_enabled(True)
+        
+        if not decoded:
+            self.qr_preview_label.setText("No QR code detected in image")
+            self.qr_info_label.setText("")
+            self.qr_connect_btn.setEnabled(False)
+            return
+        
+        # Get QR data
+        qr_text = decoded[0].data.decode('utf-8', errors='replace')
+        logger.info(f"QR code decoded: {qr_text}")
+        
+        # Parse ADB pairing data
+        # Format: WIFI:T:ADB;S:<service>;P:<password>;; or similar
+        parsed = self._parse_qr_data(qr_text)
+        
+        if parsed:
+            # Show preview
+            pixmap = QPixmap.fromImage(image).scaled(150, 150, Qt.KeepAspectRatio)
+            self.qr_preview_label.setPixmap(pixmap)
             
-            # Get QR data
-            qr_text = decoded[0].data.decode('utf-8')
-            logger.info(f"QR code decoded: {qr_text}")
+            ip, port, code = parsed
+            self.qr_info_label.setText(f"<b>Detected:</b><br>IP: {ip}<br>Port: {port}<br>Code: {code}")
+            self.qr_connect_btn.setEnabled(True)
+            self._qr_data = parsed
+        else:
+            self.qr_preview_label.setText("QR code found but format not recognized")
+            self.qr_info_label.setText(f"Raw data: {qr_text[:100]}...")
+            self.qr_connect_btn.setEnabled(False)
+    
+    def _on_qr_decode_failed(self, error: Exception):
+        """Report a background QR decode that raised"""
+        self._set_qr_input_enabled(True)
+        self.qr_connect_btn.setEnabled(False)
+        if isinstance(error, ImportError):
+            self.qr_preview_label.setText("No QR code loaded")
+            QMessageBox.warning(self, "Missing Library", "pyzbar library not installed properly.")
+        else:
+            logger.error(f"QR processing error: {error}")
+            self.qr_preview_label.setText(f"Error processing image: {error}")
+    
+    @classmethod
+    def _decode_qr(cls, image: QImage) -> list:
+        """
+        Find QR codes in an image, trying a downscaled copy of large images first
+        
+        zbar's cost grows with pixel count and it often misses QR codes in very
+        large screenshots, so those are scanned at a smaller size before
+        falling back to the original.
+        
+        Args:
+            image: Source image
             
-            # Parse ADB pairing data
-            # Format: WIFI:T:ADB;S:<service>;P:<password>;; or similar
-            parsed = self._parse_qr_data(qr_text)
+        Returns:
+            pyzbar decode results (empty if nothing was found)
+        """
+        from pyzbar.pyzbar import decode, ZBarSymbol
+        
+        # 8-bit luminance zbar can scan directly, shrunk before the copy out
+        gray = image.convertToFormat(QImage.Format.Format_Grayscale8)
+        
+        scales = [1.0]
+        longest = max(gray.width(), gray.height())
+        if longest > _QR_DOWNSCALE_THRESHOLD:
+            fit = _QR_SCAN_MAX_DIM / longest
+            scales = [fit, fit * 0.5, fit * 0.75, 1.0]
+        
+        for scale in scales:
+            candidate = gray
+            if scale != 1.0:
+                candidate = gray.scaled(
+                    round(gray.width() * scale), round(gray.height() * scale),
+                    Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
+                if candidate.isNull():
+                    continue
+            decoded = decode(cls._grayscale_pixels(candidate), symbols=[ZBarSymbol.QRCODE])
+            if decoded:
+                return decoded
+        
+        return []
+    
+    @staticmethod
+    def _grayscale_pixels(image: QImage) -> Tuple[bytes, int, int]:
+        """
+        Convert an image to the (pixels, width, height) form pyzbar accepts
+        
+        Args:
+            image: Source image in any format
             
-            if parsed:
-                # Show preview
-                pixmap = QPixmap.fromImage(image).scaled(150, 150, Qt.KeepAspectRatio)
-                self.qr_preview_label.setPixmap(pixmap)
-                
-                ip, port, code = parsed
-                self.qr_info_label.setText(f"<b>Detected:</b><br>IP: {ip}<br>Port: {port}<br>Code: {code}")
-                self.qr_connect_btn.setEnabled(True)
-                self._qr_data = parsed
-            else:
-                self.qr_preview_label.setText("QR code found but format not recognized")
-                self.qr_info_label.setText(f"Raw data: {qr_text[:100]}...")
-                self.qr_connect_btn.setEnabled(False)
-                
-        except ImportError:
-            QMessageBox.warning(self, "Missing Library", "pyzbar library not installed properly.")
-        except Exception as e:
-            logger.error(f"QR processing error: {e}")
-            self.qr_preview_label.setText(f"Error processing image: {str(e)}")
-            self.qr_connect_btn.setEnabled(False)
+        Returns:
+            Tightly packed 8-bit grayscale pixels with the image size
+        """
+        gray = image.convertToFormat(QImage.Format.Format_Grayscale8)
+        width, height = gray.width(), gray.height()
+        
+        # pyzbar needs bytes, so exactly one copy out of the QImage is unavoidable;
+        # read it straight from the image memory rather than via bits().tobytes()
+        # plus another copy into a PIL image
+        if gray.bytesPerLine() == width:
+            return gray.constBits().tobytes(), width, height
+        
+        # Scanlines are padded to 4 bytes; join the unpadded part of each row
+        # (plain slicing, so a missing optional dependency can't break decoding)
+        buf = gray.constBits()
+        stride = gray.bytesPerLine()
+        pixels = b"".join(buf[y * stride:y * stride + width] for y in range(height))
+        return pixels, width, height
     
     def _parse_qr_data(self, qr_text: str) -> Optional[Tuple[str, int, str]]:
         """
@@ -445,7 +618,7 @@ class WirelessDialog(QDialog):
         # Try WIFI:T:ADB format
         if qr_text.startswith("WIFI:"):
             parts = {}
-            for segment in qr_text.replace("WIFI:", "").rstrip(";").split(";"):
+            for segment in qr_text.removeprefix("WIFI:").rstrip(";").split(";"):
                 if ":" in segment:
                     key, value = segment.split(":", 1)
                     parts[key] = value
@@ -456,12 +629,12 @@ class WirelessDialog(QDialog):
                 password = parts.get("P", "")
                 
                 # Try to extract IP from service or other fields
-                ip_match = re.search(r'(\d+\.\d+\.\d+\.\d+):(\d+)', service)
+                ip_match = _QR_SERVICE_IP_RE.search(service)
                 if ip_match:
                     return (ip_match.group(1), int(ip_match.group(2)), password)
         
         # Try plain IP:PORT:CODE format
-        match = re.match(r'^(\d+\.\d+\.\d+\.\d+):(\d+):(\d{6})$', qr_text)
+        match = _QR_PLAIN_RE.match(qr_text)
         if match:
             return (match.group(1), int(match.group(2)), match.group(3))
         
@@ -520,130 +693,253 @@ class WirelessDialog(QDialog):
     @Slot()
     def _generate_pairing_qr(self):
         """Generate QR code for phone to scan (mDNS-based)"""
+        # Without zeroconf the phone could scan the QR but never find the service
         try:
-            import qrcode
-            from zeroconf import Zeroconf, ServiceInfo
-            
-            # Get local IP
-            local_ip = self._get_local_ip()
-            if not local_ip:
-                QMessageBox.warning(self, "Network Error", "Could not determine local IP address.")
-                return
-            
-            # Generate random service name and password
-            service_name = f"adb-{secrets.token_hex(4)}"
-            password = f"{secrets.randbelow(900000) + 100000}"  # 6-digit code
-            port = 5555 + secrets.randbelow(100)  # Random port
-            
-            # Create QR code data
-            # Format: WIFI:T:ADB;S:<service_name>;P:<password>;;
-            qr_data = f"WIFI:T:ADB;S:{service_name}@{local_ip}:{port};P:{password};;"
-            
-            # Generate QR code at target size (box_size=6 for ~200px)
-            qr = qrcode.QRCode(version=1, box_size=6, border=2)
-            qr.add_data(qr_data)
-            qr.make(fit=True)
-            
-            # Create QR image (white modules on dark background) - JUST the QR, no text
-            qr_img = qr.make_image(fill_color="white", back_color="#1e1e1e")
-            
-            # Convert to QPixmap for Qt display
-            buffer = io.BytesIO()
-            qr_img.save(buffer, format='PNG')
-            buffer.seek(0)
+            import zeroconf  # noqa: F401
+        except ImportError as e:
+            QMessageBox.warning(self, "Missing Library", f"Required library not installed: {e}")
+            return
+        
+        # Get local IP
+        local_ip = self._get_local_ip()
+        if not local_ip:
+            QMessageBox.warning(self, "Network Error", "Could not determine local IP address.")
+            return
+        
+        # Generate random service name and password
+        service_name = f"adb-{secrets.token_hex(4)}"
+        password = f"{100000 + secrets.randbelow(900000):06d}"  # 6-digit code
+        port = 5555 + secrets.randbelow(100)  # Random port
+        
+        # Create QR code data
+        # Format: WIFI:T:ADB;S:<service_name>;P:<password>;;
+        qr_data = f"WIFI:T:ADB;S:{service_name}@{local_ip}:{port};P:{password};;"
+        
+        # Encoding and rendering run on the thread pool; only the pixmap is built here
+        self.generate_qr_btn.setEnabled(False)
+        generation = self._mdns_generation
+        self._qr_render_signals = _TaskSignals()
+        self._qr_render_signals.finished.connect(
+            lambda rendered: self._on_pairing_qr_rendered(
+                rendered, service_name, local_ip, port, password, generation
+            )
+        )
+        self._qr_render_signals.failed.connect(
+            lambda error: self._on_pairing_qr_failed(error, generation)
+        )
+        QThreadPool.globalInstance().start(
+            _PoolTask(self._qr_render_signals, self._build_qr_image, qr_data)
+        )
+    
+    @staticmethod
+    def _build_qr_image(qr_data: str) -> Tuple[bytes, int, int]:
+        """
+        Render pairing data as a QR code (no Qt calls, safe off the GUI thread)
+        
+        Args:
+            qr_data: Text to encode
             
-            pixmap = QPixmap()
-            pixmap.loadFromData(buffer.read())
+        Returns:
+            Tuple of (rgb_bytes, width, height)
+        """
+        import qrcode
+        
+        # Generate QR code at target size (box_size=6 for ~200px)
+        qr = qrcode.QRCode(version=1, box_size=6, border=2)
+        qr.add_data(qr_data)
+        qr.make(fit=True)
+        
+        # Create QR image (white modules on dark background) - JUST the QR, no text
+        qr_img = qr.make_image(fill_color="white", back_color="#1e1e1e")
+        rgb = qr_img.get_image().convert('RGB')
+        return rgb.tobytes(), rgb.width, rgb.height
+    
+    def _on_pairing_qr_rendered(self, rendered: Tuple[bytes, int, int], service_name: str,
+                                local_ip: str, port: int, password: str, generation: int):
+        """Show the rendered pairing QR code and advertise the pairing service"""
+        if generation != self._mdns_generation:
+            return  # Dialog closed while the QR code was rendering
+        
+        try:
+            # Hand the raw RGB pixels to Qt instead of a PNG encode/decode round-trip;
+            # copy() detaches the QImage from the bytes buffer
+            rgb_bytes, width, height = rendered
+            qimage = QImage(
+                rgb_bytes, width, height, width * 3, QImage.Format.Format_RGB888
+            ).copy()
+            pixmap = QPixmap.fromImage(qimage)
             
             # Hide placeholder, show QR image
             self.qr_placeholder_label.setVisible(False)
             self.qr_display_label.setVisible(True)
             self.qr_display_label.setPixmap(pixmap)
             
-            # Start mDNS service in background thread (avoids UI freeze)
-            self._mdns_thread = threading.Thread(
-                target=self._start_mdns_service,
-                args=(service_name, local_ip, port, password),
-                daemon=True
-            )
-            self._mdns_thread.start()
-            
             # Display connection info in status label BELOW the container
             self.mdns_status_label.setText(
                 f"<b>IP:</b> {local_ip}  |  <b>Port:</b> {port}  |  <b>Code:</b> {password}"
             )
             
-            self.generate_qr_btn.setEnabled(False)
-            self.stop_mdns_btn.setEnabled(True)
+            # Zeroconf startup and registration block, so they run on the thread pool.
+            # The worker gets the instance to reuse (or the stale one to close) and
+            # hands every object back; only the GUI thread stores them
+            reuse = stale = None
+            if self._zeroconf is not None:
+                if self._zeroconf_ip == local_ip:
+                    reuse = self._zeroconf
+                else:
+                    stale = self._zeroconf
+                self._zeroconf = None
+                self._zeroconf_ip = None
+            
+            self._mdns_signals = _TaskSignals()
+            self._mdns_signals.finished.connect(
+                lambda started: self._on_mdns_started(started, local_ip, generation)
+            )
+            self._mdns_signals.failed.connect(
+                lambda error: self._on_mdns_failed(error, generation)
+            )
+            QThreadPool.globalInstance().start(
+                _PoolTask(self._mdns_signals, self._start_mdns_service,
+                          reuse, stale, service_name, local_ip, port, password)
+            )
             
-        except ImportError as e:
-            QMessageBox.warning(self, "Missing Library", f"Required library not installed: {e}")
         except Exception as e:
-            logger.error(f"QR generation error: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to generate QR code: {e}")
+            self._on_pairing_qr_failed(e, generation)
+    
+    def _on_pairing_qr_failed(self, error: Exception, generation: int):
+        """Report a pairing QR code that could not be generated"""
+        if generation != self._mdns_generation:
+            return
+        self.generate_qr_btn.setEnabled(True)
+        if isinstance(error, ImportError):
+            QMessageBox.warning(self, "Missing Library", f"Required library not installed: {error}")
+        else:
+            logger.error(f"QR generation error: {error}")
+            QMessageBox.warning(self, "Error", f"Failed to generate QR code: {error}")
     
     def _get_local_ip(self) -> Optional[str]:
-        """Get local IP address"""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception:
-            return None
+        """Get local IP address, reusing a recent result"""
+        now = time.monotonic()
+        if self._cached_ip and now - self._cached_ip_ts < _LOCAL_IP_TTL:
+            return self._cached_ip
+        
+        self._cached_ip = self._probe_local_ip()
+        self._cached_ip_ts = now
+        return self._cached_ip
     
-    def _start_mdns_service(self, name: str, ip: str, port: int, password: str):
-        """Start mDNS service and pairing listener for QR pairing"""
+    def _probe_local_ip(self) -> Optional[str]:
+        """Determine the local IP address"""
+        # Connecting a UDP socket sends nothing; it only picks the default-route
+        # interface, which is the one the phone is most likely to share
         try:
-            from zeroconf import Zeroconf, ServiceInfo
-            import socket
-            import subprocess
-            
-            self._zeroconf = Zeroconf()
-            self._pairing_active = True
-            
-            # Create service info for ADB pairing
-            service_type = "_adb-tls-pairing._tcp.local."
-            service_name = f"{name}.{service_type}"
-            
-            info = ServiceInfo(
-                service_type,
-                service_name,
-                addresses=[socket.inet_aton(ip)],
-                port=port,
-                properties={
-                    "pw": password,
-                },
-            )
-            
-            self._zeroconf.register_service(info)
-            self._mdns_service = info
-            
-            logger.info(f"mDNS service registered: {service_name}")
-            
-            # Monitor for incoming pairing requests by watching mDNS
-            # The phone will advertise its own pairing service when it scans the QR
-            self._listen_for_phone_pairing(password)
-            
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
+        except OSError:
+            pass
+        
+        # No default route (e.g. an isolated LAN): use the first private address
+        try:
+            import psutil
+            for addrs in psutil.net_if_addrs().values():
+                for addr in addrs:
+                    if addr.family != socket.AF_INET:
+                        continue
+                    ip = IPv4Address(addr.address)
+                    if ip.is_private and not ip.is_loopback and not ip.is_link_local:
+                        return addr.address
         except Exception as e:
-            logger.error(f"mDNS service error: {e}")
-            # Update status on main thread
-            from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(
-                self.mdns_status_label, "setText", 
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(str, f"mDNS Error: {e}")
-            )
+            logger.debug(f"Interface enumeration failed: {e}")
+        
+        return None
     
-    def _listen_for_phone_pairing(self, password: str):
-        """Listen for phone's pairing service and complete pairing with adb pair"""
+    def _start_mdns_service(self, reuse, stale, name: str, ip: str, port: int, password: str):
+        """
+        Register the pairing service and start the pairing listener (runs on the thread pool)
+        
+        Nothing here writes dialog state; the objects are returned to _on_mdns_started.
+        
+        Args:
+            reuse: Zeroconf instance already bound to ip, or None to create one
+            stale: Zeroconf instance bound to an old address, closed here
+            name: Service instance name
+            ip: Local address to advertise and bind to
+            port: Advertised pairing port
+            password: Pairing code
+            
+        Returns:
+            Tuple of (zeroconf, service_info, browser)
+        """
+        from zeroconf import Zeroconf, ServiceInfo, IPVersion
+        
+        if stale is not None:
+            stale.close()
+        
+        # Zeroconf startup spawns threads and opens multicast sockets,
+        # so one instance serves every generate/stop cycle on the same address.
+        # Bind it to the LAN interface only, IPv4 only, rather than every adapter
+        zeroconf = reuse or Zeroconf(interfaces=[ip], ip_version=IPVersion.V4Only)
+        
+        # Create service info for ADB pairing
+        service_type = "_adb-tls-pairing._tcp.local."
+        service_name = f"{name}.{service_type}"
+        
+        info = ServiceInfo(
+            service_type,
+            service_name,
+            addresses=[socket.inet_aton(ip)],
+            port=port,
+            properties={
+                "pw": password,
+            },
+        )
+        
         try:
-            from zeroconf import ServiceBrowser, ServiceListener
-            import subprocess
-            import time
+            zeroconf.register_service(info)
+        except Exception:
+            zeroconf.close()
+            raise
+        
+        logger.info(f"mDNS service registered: {service_name}")
+        
+        # Monitor for incoming pairing requests by watching mDNS
+        # The phone will advertise its own pairing service when it scans the QR
+        browser = self._listen_for_phone_pairing(zeroconf, ip, password)
+        return zeroconf, info, browser
+    
+    def _on_mdns_started(self, started: tuple, ip: str, generation: int):
+        """Take ownership of a started pairing service, or release it if it was stopped meanwhile"""
+        if generation != self._mdns_generation:
+            # Stop or close happened while the worker ran; nothing may stay advertised
+            _release_mdns(*started)
+            return
+        
+        self._zeroconf, self._mdns_service, self._mdns_browser = started
+        self._zeroconf_ip = ip
+        self.stop_mdns_btn.setEnabled(True)
+    
+    def _on_mdns_failed(self, error: Exception, generation: int):
+        """Report an mDNS service that failed to start"""
+        logger.error(f"mDNS service error: {error}")
+        if generation != self._mdns_generation:
+            return
+        self._stop_mdns_service()
+        self.mdns_status_label.setText(f"mDNS Error: {error}")
+    
+    def _listen_for_phone_pairing(self, zeroconf, local_ip: str, password: str):
+        """
+        Listen for phone's pairing service and complete pairing with adb pair
+        
+        Args:
+            zeroconf: Zeroconf instance to browse on
+            local_ip: Address zeroconf is bound to, used to skip our own service
+            password: Pairing code
             
-            local_ip = self._get_local_ip()
+        Returns:
+            ServiceBrowser, or None if the listener could not be started
+        """
+        try:
+            from zeroconf import ServiceBrowser, ServiceListener
             
             class PhonePairingListener(ServiceListener):
                 def __init__(self, parent, password, local_ip):
@@ -678,7 +974,6 @@ class WirelessDialog(QDialog):
                                 self.paired = True
                                 logger.info("Pairing successful!")
                                 # Update UI on main thread
-                                from PySide6.QtCore import QMetaObject, Qt, Q_ARG
                                 QMetaObject.invokeMethod(
                                     self.parent.mdns_status_label, "setText",
                                     Qt.ConnectionType.QueuedConnection,
@@ -712,31 +1007,31 @@ class WirelessDialog(QDialog):
             # Browse for phone's pairing service
             listener = PhonePairingListener(self, password, local_ip)
             browser = ServiceBrowser(
-                self._zeroconf, 
+                zeroconf, 
                 "_adb-tls-pairing._tcp.local.", 
                 listener
             )
-            self._mdns_browser = browser
             
             logger.info("Listening for phone pairing service...")
+            return browser
             
         except Exception as e:
             logger.error(f"Phone pairing listener error: {e}")
+            return None
     
     @Slot()
     def _stop_mdns_service(self):
         """Stop mDNS service"""
+        # Any start still running on the pool releases its service when it reports back
+        self._mdns_generation += 1
         try:
             # Stop the browser first
-            if hasattr(self, '_mdns_browser') and self._mdns_browser:
+            if self._mdns_browser:
                 self._mdns_browser.cancel()
                 self._mdns_browser = None
             
-            self._pairing_active = False
-            
-            if self._mdns_service and hasattr(self, '_zeroconf'):
+            if self._mdns_service and self._zeroconf:
                 self._zeroconf.unregister_service(self._mdns_service)
-                self._zeroconf.close()
                 self._mdns_service = None
                 logger.info("mDNS service stopped")
         except Exception as e:
@@ -750,7 +1045,22 @@ class WirelessDialog(QDialog):
         self.generate_qr_btn.setEnabled(True)
         self.stop_mdns_btn.setEnabled(False)
     
+    def _close_zeroconf(self):
+        """Stop mDNS and release the shared Zeroconf instance"""
+        self._stop_mdns_service()
+        if self._zeroconf is not None:
+            try:
+                self._zeroconf.close()
+            except Exception as e:
+                logger.error(f"Error closing Zeroconf: {e}")
+            self._zeroconf = None
+    
+    def done(self, result):
+        """Clean up when the dialog is accepted or rejected"""
+        self._close_zeroconf()
+        super().done(result)
+    
     def closeEvent(self, event):
         """Clean up on close"""
-        self._stop_mdns_service()
+        self._close_zeroconf()
         super().closeEvent(event)
@@ -5,6 +5,10 @@ Provides tabbed interface for all application settings.
 """
 
 import logging
+import os
+import platform
+import shutil
+import subprocess
 from pathlib import Path
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
@@ -12,7 +16,7 @@ from PySide6.QtWidgets import (
     QSpinBox, QCheckBox, QComboBox, QLabel,
     QFileDialog, QGroupBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Slot, QSettings
+from PySide6.QtCore import Qt, Slot, Signal, QSettings, QObject, QRunnable, QThreadPool
 from PySide6.QtWidgets import QApplication
 
 from gui.themes import Theme
@@ -20,6 +24,83 @@ from utils.update_checker import UpdateChecker
 
 logger = logging.getLogger(__name__)
 
+# Defaults resolved once at import rather than on every tab load
+_DARK = Theme.DARK.value
+_LIGHT = Theme.LIGHT.value
+_DEFAULT_DOWNLOAD_DIR = str(Path.home() / 'Downloads')
+_LOG_PATH = Path.cwd() / 'logs'
+_LOG_DIR = str(_LOG_PATH)
+_OPEN_FOLDER_CMD = {'Windows': 'explorer', 'Darwin': 'open'}.get(platform.system(), 'xdg-open')
+_TEMP_BINARY_DIRS = ("binaries_temp", "binaries_temp_scrcpy")
+
+
+def _do_clear_cache():
+    """
+    Delete the device cache, log files and temporary binaries
+    
+    Runs on the thread pool, so it must not touch any widgets.
+    
+    Returns:
+        Tuple of (deleted log file count, error message or empty string)
+    """
+    deleted_count = 0
+    try:
+        # 1. Clear device cache
+        cache_file = Path("config/device_cache.json")
+        if cache_file.exists():
+            cache_file.unlink()
+            logger.info("Removed device cache file")
+
+        # 2. Clear logs (the current log file is likely locked, so ignore errors).
+        # scandir yields plain dir entries instead of building a Path per file
+        try:
+            with os.scandir("logs") as entries:
+                for entry in entries:
+                    if entry.name.endswith('.log') and entry.is_file():
+                        try:
+                            os.unlink(entry.path)
+                            deleted_count += 1
+                        except OSError:
+                            pass # Likely currently open
+            logger.info(f"Cleared {deleted_count} log files")
+        except FileNotFoundError:
+            pass
+        
+        # 3. Clear temp binaries if any
+        for temp_dir in _TEMP_BINARY_DIRS:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    except Exception as e:
+        logger.error(f"Error clearing cache: {e}")
+        return deleted_count, str(e)
+    
+    logger.info("Cache clearing completed")
+    return deleted_count, ""
+
+
+class _ClearCacheSignals(QObject):
+    """Signals for reporting a background cache clear to the GUI thread"""
+    
+    finished = Signal(int, str)  # Deleted log count, error message
+
+
+class _ClearCacheTask(QRunnable):
+    """Runs the cache clearing file IO off the GUI thread"""
+    
+    def __init__(self, signals: _ClearCacheSignals):
+        """
+        Initialize cache clear task
+        
+        Args:
+            signals: Signals to report the result through
+        """
+        super().__init__()
+        self._signals = signals
+    
+    def run(self):
+        """Clear the cache and emit the result"""
+        self._signals.finished.emit(*_do_clear_cache())
+
 
 class SettingsDialog(QDialog):
     """Settings dialog with tabbed interface"""
@@ -35,7 +116,7 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self.settings = settings
         self._setup_ui()
-        self._load_settings()
+        self._ensure_tab_built(0)
     
     def _setup_ui(self):
         """Setup user interface"""
@@ -45,12 +126,21 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self)
         
         # Tab widget
+        # Tabs are built on first visit; each entry is (title, create, load, collect)
+        self._tab_specs = [
+            ("General", self._create_general_tab, self._load_general_settings, self._collect_general_settings),
+            ("ADB", self._create_adb_tab, self._load_adb_settings, self._collect_adb_settings),
+            ("File Transfer", self._create_file_tab, self._load_file_settings, self._collect_file_settings),
+            ("Mirroring", self._create_mirror_tab, self._load_mirror_settings, self._collect_mirror_settings),
+            ("Advanced", self._create_advanced_tab, self._load_advanced_settings, self._collect_advanced_settings),
+        ]
+        self._tab_built = [False] * len(self._tab_specs)
+        self._loaded = {}  # Values shown when each tab was loaded, to save only changes
+        
         self.tabs = QTabWidget()
-        self.tabs.addTab(self._create_general_tab(), "General")
-        self.tabs.addTab(self._create_adb_tab(), "ADB")
-        self.tabs.addTab(self._create_file_tab(), "File Transfer")
-        self.tabs.addTab(self._create_mirror_tab(), "Mirroring")
-        self.tabs.addTab(self._create_advanced_tab(), "Advanced")
+        for title, *_ in self._tab_specs:
+            self.tabs.addTab(QWidget(), title)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         layout.addWidget(self.tabs)
         
@@ -290,82 +380,145 @@ class SettingsDialog(QDialog):
         maintenance_group = QGroupBox("Maintenance")
         maintenance_layout = QVBoxLayout(maintenance_group)
         
-        clear_cache_btn = QPushButton("Clear Cache")
-        clear_cache_btn.clicked.connect(self._clear_cache)
-        maintenance_layout.addWidget(clear_cache_btn)
+        self.clear_cache_btn = QPushButton("Clear Cache")
+        self.clear_cache_btn.clicked.connect(self._clear_cache)
+        maintenance_layout.addWidget(self.clear_cache_btn)
         
         layout.addWidget(maintenance_group)
         
         layout.addStretch()
         return widget
     
+    @Slot(int)
+    def _ensure_tab_built(self, index: int):
+        """
+        Build a tab's widgets the first time it is shown
+        
+        Args:
+            index: Tab index
+        """
+        if index < 0 or self._tab_built[index]:
+            return
+        self._tab_built[index] = True
+        
+        title, create, load, collect = self._tab_specs[index]
+        widget = create()
+        
+        # Swapping the placeholder changes the current tab; don't re-enter
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        load()
+        self._loaded.update(collect())
+    
     def _load_settings(self):
-        """Load settings from QSettings"""
-        # General
-        theme = self.settings.value('theme', Theme.DARK.value)
-        self.theme_combo.setCurrentText("Dark" if theme == Theme.DARK.value else "Light")
+        """Load settings from QSettings into the tabs built so far"""
+        for built, (_, _, load, collect) in zip(self._tab_built, self._tab_specs):
+            if built:
+                load()
+                self._loaded.update(collect())
+    
+    def _load_general_settings(self):
+        """Load General tab settings"""
+        theme = self.settings.value('theme', _DARK)
+        self.theme_combo.setCurrentText("Dark" if theme == _DARK else "Light")
         self.auto_connect_check.setChecked(self.settings.value('auto_connect', False, type=bool))
         self.minimize_tray_check.setChecked(self.settings.value('minimize_tray', False, type=bool))
-        
-        # ADB
+    
+    def _load_adb_settings(self):
+        """Load ADB tab settings"""
         self.adb_path_input.setText(self.settings.value('adb_path', ''))
         self.connection_timeout_spin.setValue(self.settings.value('connection_timeout', 30, type=int))
         self.scan_interval_spin.setValue(self.settings.value('scan_interval', 2, type=int))
         self.wireless_port_spin.setValue(self.settings.value('wireless_port', 5555, type=int))
-        
-        # File Transfer
-        self.download_path_input.setText(self.settings.value('download_path', str(Path.home() / 'Downloads')))
+    
+    def _load_file_settings(self):
+        """Load File Transfer tab settings"""
+        self.download_path_input.setText(self.settings.value('download_path', _DEFAULT_DOWNLOAD_DIR))
         self.buffer_size_spin.setValue(self.settings.value('buffer_size', 8, type=int))
         self.confirm_overwrite_check.setChecked(self.settings.value('confirm_overwrite', True, type=bool))
         self.show_hidden_check.setChecked(self.settings.value('show_hidden', False, type=bool))
-        
-        # Mirroring
+    
+    def _load_mirror_settings(self):
+        """Load Mirroring tab settings"""
         self.scrcpy_path_input.setText(self.settings.value('scrcpy_path', ''))
         self.resolution_combo.setCurrentText(self.settings.value('mirror_resolution', 'Auto'))
         self.bitrate_spin.setValue(self.settings.value('mirror_bitrate', 8, type=int))
         self.fps_spin.setValue(self.settings.value('mirror_fps', 60, type=int))
         self.always_on_top_check.setChecked(self.settings.value('mirror_always_on_top', False, type=bool))
         self.fullscreen_check.setChecked(self.settings.value('mirror_fullscreen', False, type=bool))
-        
-        # Advanced
+    
+    def _load_advanced_settings(self):
+        """Load Advanced tab settings"""
         self.debug_logging_check.setChecked(self.settings.value('debug_logging', False, type=bool))
-        self.log_path_input.setText(str(Path.cwd() / 'logs'))
+        self.log_path_input.setText(_LOG_DIR)
     
     @Slot()
     def _save_settings(self):
-        """Save settings to QSettings"""
-        # General
-        theme_value = Theme.DARK.value if self.theme_combo.currentText() == "Dark" else Theme.LIGHT.value
-        self.settings.setValue('theme', theme_value)
-        self.settings.setValue('auto_connect', self.auto_connect_check.isChecked())
-        self.settings.setValue('minimize_tray', self.minimize_tray_check.isChecked())
-        
-        # ADB
-        self.settings.setValue('adb_path', self.adb_path_input.text())
-        self.settings.setValue('connection_timeout', self.connection_timeout_spin.value())
-        self.settings.setValue('scan_interval', self.scan_interval_spin.value())
-        self.settings.setValue('wireless_port', self.wireless_port_spin.value())
-        
-        # File Transfer
-        self.settings.setValue('download_path', self.download_path_input.text())
-        self.settings.setValue('buffer_size', self.buffer_size_spin.value())
-        self.settings.setValue('confirm_overwrite', self.confirm_overwrite_check.isChecked())
-        self.settings.setValue('show_hidden', self.show_hidden_check.isChecked())
-        
-        # Mirroring
-        self.settings.setValue('scrcpy_path', self.scrcpy_path_input.text())
-        self.settings.setValue('mirror_resolution', self.resolution_combo.currentText())
-        self.settings.setValue('mirror_bitrate', self.bitrate_spin.value())
-        self.settings.setValue('mirror_fps', self.fps_spin.value())
-        self.settings.setValue('mirror_always_on_top', self.always_on_top_check.isChecked())
-        self.settings.setValue('mirror_fullscreen', self.fullscreen_check.isChecked())
-        
-        # Advanced
-        self.settings.setValue('debug_logging', self.debug_logging_check.isChecked())
+        """Save settings to QSettings (tabs never opened keep their stored values)"""
+        pending = {}
+        for built, (_, _, _, collect) in zip(self._tab_built, self._tab_specs):
+            if built:
+                pending.update(collect())
+        
+        # Write only what changed since loading, then flush once
+        for key, value in pending.items():
+            if self._loaded.get(key) != value:
+                self.settings.setValue(key, value)
+        self.settings.sync()
         
         logger.info("Settings saved")
         self.accept()
     
+    def _collect_general_settings(self) -> dict:
+        """Collect General tab settings"""
+        theme_value = _DARK if self.theme_combo.currentText() == "Dark" else _LIGHT
+        return {
+            'theme': theme_value,
+            'auto_connect': self.auto_connect_check.isChecked(),
+            'minimize_tray': self.minimize_tray_check.isChecked(),
+        }
+    
+    def _collect_adb_settings(self) -> dict:
+        """Collect ADB tab settings"""
+        return {
+            'adb_path': self.adb_path_input.text(),
+            'connection_timeout': self.connection_timeout_spin.value(),
+            'scan_interval': self.scan_interval_spin.value(),
+            'wireless_port': self.wireless_port_spin.value(),
+        }
+    
+    def _collect_file_settings(self) -> dict:
+        """Collect File Transfer tab settings"""
+        return {
+            'download_path': self.download_path_input.text(),
+            'buffer_size': self.buffer_size_spin.value(),
+            'confirm_overwrite': self.confirm_overwrite_check.isChecked(),
+            'show_hidden': self.show_hidden_check.isChecked(),
+        }
+    
+    def _collect_mirror_settings(self) -> dict:
+        """Collect Mirroring tab settings"""
+        return {
+            'scrcpy_path': self.scrcpy_path_input.text(),
+            'mirror_resolution': self.resolution_combo.currentText(),
+            'mirror_bitrate': self.bitrate_spin.value(),
+            'mirror_fps': self.fps_spin.value(),
+            'mirror_always_on_top': self.always_on_top_check.isChecked(),
+            'mirror_fullscreen': self.fullscreen_check.isChecked(),
+        }
+    
+    def _collect_advanced_settings(self) -> dict:
+        """Collect Advanced tab settings"""
+        return {
+            'debug_logging': self.debug_logging_check.isChecked(),
+        }
+    
     @Slot()
     def _reset_defaults(self):
         """Reset all settings to defaults"""
@@ -418,18 +571,15 @@ class SettingsDialog(QDialog):
     @Slot()
     def _open_log_folder(self):
         """Open log folder in file explorer"""
-        import subprocess
-        import platform
-        
-        log_path = Path(self.log_path_input.text())
-        log_path.mkdir(parents=True, exist_ok=True)
-        
-        if platform.system() == 'Windows':
-            subprocess.run(['explorer', str(log_path)])
-        elif platform.system() == 'Darwin':
-            subprocess.run(['open', str(log_path)])
-        else:
-            subprocess.run(['xdg-open', str(log_path)])
+        # The log path field is read-only, so the folder is always _LOG_PATH
+        if not _LOG_PATH.is_dir():
+            _LOG_PATH.mkdir(parents=True, exist_ok=True)
+        
+        # Popen returns immediately; run() would freeze the dialog until the file manager exits
+        try:
+            subprocess.Popen([_OPEN_FOLDER_CMD, _LOG_DIR])
+        except OSError as e:
+            logger.error(f"Failed to open log folder: {e}")
     
     @Slot()
     def _clear_cache(self):
@@ -442,46 +592,27 @@ class SettingsDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                # 1. Clear device cache
-                cache_file = Path("config/device_cache.json")
-                if cache_file.exists():
-                    cache_file.unlink()
-                    logger.info("Removed device cache file")
-
-                # 2. Clear logs (keep current log file if possible, or just delete old ones)
-                log_dir = Path("logs")
-                if log_dir.exists():
-                    current_log = None
-                    # Try to identify current log file (it's locked likely)
-                    # Simple approach: try to delete all, ignore errors for locked files
-                    deleted_count = 0
-                    for log_file in log_dir.glob("*.log"):
-                        try:
-                            log_file.unlink()
-                            deleted_count += 1
-                        except OSError:
-                            pass # Likely currently open
-                    logger.info(f"Cleared {deleted_count} log files")
-                
-                # 3. Clear temp binaries if any
-                for temp_dir in ["binaries_temp", "binaries_temp_scrcpy"]:
-                    path = Path(temp_dir)
-                    if path.exists():
-                        import shutil
-                        shutil.rmtree(path, ignore_errors=True)
-
-                QMessageBox.information(
-                    self, 
-                    "Cache Cleared", 
-                    "Temporary files, logs, and device cache have been cleared.\n"
-                    "Some settings may take effect after restart."
-                )
-                logger.info("Cache clearing completed")
-            
-            except Exception as e:
-                logger.error(f"Error clearing cache: {e}")
-                QMessageBox.warning(self, "Error", f"Failed to clear some cache files: {e}")
+            # Deleting logs and temp binaries can take a while, keep the dialog responsive
+            self.clear_cache_btn.setEnabled(False)
+            self._clear_cache_signals = _ClearCacheSignals()
+            self._clear_cache_signals.finished.connect(self._on_cache_cleared)
+            QThreadPool.globalInstance().start(_ClearCacheTask(self._clear_cache_signals))
+    
+    @Slot(int, str)
+    def _on_cache_cleared(self, deleted_count: int, error: str):
+        """Report the result of a background cache clear"""
+        self.clear_cache_btn.setEnabled(True)
+        
+        if error:
+            QMessageBox.warning(self, "Error", f"Failed to clear some cache files: {error}")
+            return
+        
+        QMessageBox.information(
+            self, 
+            "Cache Cleared", 
+            "Temporary files, logs, and device cache have been cleared.\n"
+            "Some settings may take effect after restart."
+        )
 
     @Slot()
     def _check_for_updates(self):
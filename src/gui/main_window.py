@@ -321,6 +321,7 @@ class MainWindow(QMainWindow):
         dialog = SettingsDialog(self.settings, self)
         if dialog.exec():
             self._load_theme()
+            self.mirror_viewer.mirror_engine.invalidate_settings()
     
     @Slot()
     def _show_about(self):
@@ -348,6 +349,9 @@ class MainWindow(QMainWindow):
         
         self.device_manager.stop_monitoring()
         
+        # os._exit() below skips QSettings teardown, so flush pending writes now
+        self.settings.sync()
+        
         # This prevents async cleanup from racing with event loop shutdown
         
         if self.logcat_streamer.is_streaming():
@@ -357,8 +361,6 @@ class MainWindow(QMainWindow):
         
         if self.shell_manager.is_active():
             self.shell_manager._active = False  # Signal stop
-            if hasattr(self.shell_manager, '_read_task') and self.shell_manager._read_task:
-                self.shell_manager._read_task.cancel()
             if hasattr(self.shell_manager, '_process') and self.shell_manager._process:
                 try:
                     self.shell_manager._process.terminate()
@@ -367,8 +369,6 @@ class MainWindow(QMainWindow):
         
         if hasattr(self.mirror_viewer, 'mirror_engine'):
             engine = self.mirror_viewer.mirror_engine
-            if hasattr(engine, '_monitor_timer'):
-                engine._monitor_timer.stop()
             if hasattr(engine, '_process') and engine._process:
                 try:
                     engine._process.terminate()
@@ -117,7 +117,7 @@ class FileExplorerWidget(QWidget):
         self.current_device = device
         asyncio.ensure_future(self._load_directory(self.current_path))
     
-    async def _load_directory(self, path: str):
+    async def _load_directory(self, path: str, use_cache: bool = True):
         """Load directory contents"""
         logger.debug(f"File Explorer: Loading directory {path}, device={self.current_device}")
         
@@ -133,36 +133,37 @@ class FileExplorerWidget(QWidget):
         
         try:
             self.file_tree.clear()
-            files = await self.file_manager.list_directory(self.current_device, path)
+            files = await self.file_manager.list_directory(
+                self.current_device, path, use_cache=use_cache
+            )
             
             logger.debug(f"File Explorer: Received {len(files)} files")
             
-            directories = [f for f in files if f.is_directory]
-            regular_files = [f for f in files if not f.is_directory]
+            # Directories first; sort is stable so listing order is kept within each group
+            files.sort(key=lambda f: not f.is_directory)
             
-            for file_info in directories + regular_files:
-                name = file_info.name
+            bold_font = None
+            items = []
+            for file_info in files:
                 if file_info.is_directory:
-                    name = f"📁 {name}"
+                    item = QTreeWidgetItem([
+                        f"📁 {file_info.name}", "<DIR>",
+                        file_info.permissions, file_info.modified_time
+                    ])
+                    if bold_font is None:
+                        bold_font = item.font(0)
+                        bold_font.setBold(True)
+                    item.setFont(0, bold_font)
                 else:
-                    name = f"📄 {name}"
-                
-                modified = file_info.modified_time if hasattr(file_info, 'modified_time') else ""
-                
-                item = QTreeWidgetItem([
-                    name,
-                    file_info.display_size if not file_info.is_directory else "<DIR>",
-                    file_info.permissions,
-                    modified
-                ])
+                    item = QTreeWidgetItem([
+                        f"📄 {file_info.name}", file_info.display_size,
+                        file_info.permissions, file_info.modified_time
+                    ])
                 item.setData(0, Qt.UserRole, file_info)
-                
-                if file_info.is_directory:
-                    font = item.font(0)
-                    font.setBold(True)
-                    item.setFont(0, font)
-                
-                self.file_tree.addTopLevelItem(item)
+                items.append(item)
+            
+            # Insert in one call so the view lays out once, not per row
+            self.file_tree.addTopLevelItems(items)
             
             self.current_path = path
             self.path_edit.setText(path)
@@ -195,7 +196,7 @@ class FileExplorerWidget(QWidget):
     @Slot()
     def _refresh_directory(self):
         """Refresh current directory"""
-        asyncio.ensure_future(self._load_directory(self.current_path))
+        asyncio.ensure_future(self._load_directory(self.current_path, use_cache=False))
     
     @Slot(QTreeWidgetItem, int)
     def _item_double_clicked(self, item: QTreeWidgetItem, column: int):
@@ -206,20 +207,22 @@ class FileExplorerWidget(QWidget):
     
     @Slot()
     def _push_file(self):
-        """Push file to device"""
+        """Push files to device"""
         if not self.current_device:
             show_warning(self, "ADB Manager", "No device selected")
             return
         
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select File to Push")
-        if not file_path:
+        file_paths, _ = QFileDialog.getOpenFileNames(self, "Select Files to Push")
+        if not file_paths:
             return
         
-        local_path = Path(file_path)
-        remote_path = f"{self.current_path}/{local_path.name}"
+        pairs = [
+            (Path(file_path), f"{self.current_path}/{Path(file_path).name}")
+            for file_path in file_paths
+        ]
         
         asyncio.ensure_future(
-            self.file_manager.push_file(self.current_device, local_path, remote_path)
+            self.file_manager.push_files_batched(self.current_device, pairs)
         )
     
     @Slot()
@@ -139,7 +139,7 @@ class LogcatViewerWidget(QWidget):
     
     def _connect_signals(self):
         """Connect logcat streamer signals"""
-        self.logcat_streamer.log_entry.connect(self._add_log_entry)
+        self.logcat_streamer.log_entries.connect(self._add_log_entries)
         self.logcat_streamer.streaming_started.connect(self._on_streaming_started)
         self.logcat_streamer.streaming_stopped.connect(self._on_streaming_stopped)
     
@@ -227,30 +227,33 @@ class LogcatViewerWidget(QWidget):
         """Refresh the display by refiltering the buffer"""
         self.log_display.clear()
         
-        for entry in self._log_buffer:
-            if self._entry_passes_filter(entry):
-                self._display_entry(entry, auto_scroll=False)
+        self._display_entries(
+            [entry for entry in self._log_buffer if self._entry_passes_filter(entry)],
+            auto_scroll=False
+        )
         
         self.log_display.verticalScrollBar().setValue(
             self.log_display.verticalScrollBar().maximum()
         )
         self._user_scrolled_up = False
     
-    def _display_entry(self, entry: dict, auto_scroll: bool = True):
-        """Display a single log entry"""
-        level = entry.get('level', 'I')
-        log_line = self._format_log_entry(entry)
-        
-        color = self.LEVEL_COLORS.get(level, QColor(212, 212, 212))
+    def _display_entries(self, entries: list, auto_scroll: bool = True):
+        """Display log entries as a single edit block"""
+        if not entries:
+            return
         
         cursor = self.log_display.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
         
         format = cursor.charFormat()
-        format.setForeground(color)
-        cursor.setCharFormat(format)
+        for entry in entries:
+            level = entry.get('level', 'I')
+            format.setForeground(self.LEVEL_COLORS.get(level, QColor(212, 212, 212)))
+            cursor.setCharFormat(format)
+            cursor.insertText(self._format_log_entry(entry) + '\n')
         
-        cursor.insertText(log_line + '\n')
+        cursor.endEditBlock()
         
         if auto_scroll and not self._user_scrolled_up:
             self.log_display.setTextCursor(cursor)
@@ -290,21 +293,22 @@ class LogcatViewerWidget(QWidget):
         """Stop logcat streaming"""
         safe_ensure_future(self.logcat_streamer.stop_streaming())
     
-    @Slot(dict)
-    def _add_log_entry(self, entry: dict):
+    @Slot(list)
+    def _add_log_entries(self, entries: list):
         """
-        Add log entry to display
+        Add a batch of log entries to display
         
         Args:
-            entry: Log entry dict with timestamp, level, tag, message
+            entries: Log entry dicts with timestamp, level, tag, message
         """
-        self._log_buffer.append(entry)
+        self._log_buffer.extend(entries)
         
         if len(self._log_buffer) > self._max_buffer_size:
             self._log_buffer = self._log_buffer[-self._max_buffer_size:]
         
-        if self._entry_passes_filter(entry):
-            self._display_entry(entry)
+        self._display_entries(
+            [entry for entry in entries if self._entry_passes_filter(entry)]
+        )
     
     def _clear_logs(self):
         """Clear logs and buffer"""
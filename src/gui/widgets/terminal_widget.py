@@ -5,7 +5,6 @@ This widget provides a terminal-like interface for executing commands
 on Android devices via ADB shell.
 """
 
-import asyncio
 import logging
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLineEdit,
@@ -101,6 +100,7 @@ class TerminalWidget(QWidget):
     def _connect_signals(self):
         """Connect shell manager signals"""
         self.shell_manager.output_received.connect(self._add_output)
+        self.shell_manager.command_finished.connect(self._add_prompt)
         self.shell_manager.shell_started.connect(self._on_shell_started)
         self.shell_manager.shell_stopped.connect(self._on_shell_stopped)
         self.shell_manager.shell_error.connect(self._on_shell_error)
@@ -159,18 +159,12 @@ class TerminalWidget(QWidget):
         if command.startswith('cd ') or command == 'cd':
             self._update_path_from_cd(command)
         
-        safe_ensure_future(self._execute_and_prompt(command))
+        # The prompt follows once the shell reports the command finished
+        safe_ensure_future(self.shell_manager.execute_command(command))
         
         self.command_input.clear()
         self.shell_manager.reset_history_index()
     
-    async def _execute_and_prompt(self, command: str):
-        """Execute command and show prompt after output"""
-        await self.shell_manager.execute_command(command)
-        await asyncio.sleep(0.5)
-        self._add_prompt()
-
-    
     def eventFilter(self, obj, event):
         """Handle key events for command history"""
         if obj == self.command_input and event.type() == QKeyEvent.Type.KeyPress:
@@ -193,18 +187,27 @@ class TerminalWidget(QWidget):
         Add output to terminal
         
         Args:
-            output: Output text
+            output: Output text (may span several lines)
             is_error: True if error output
         """
-        # Skip if output is just the echoed command we sent
-        stripped = output.strip()
-        if self.last_command and stripped == self.last_command:
+        kept = []
+        for line in output.splitlines(keepends=True):
+            stripped = line.strip()
+            
+            # Skip if output is just the echoed command we sent
+            if self.last_command and stripped == self.last_command:
+                continue
+            
+            # Skip shell prompt echoes (lines ending with $ or #)
+            if stripped.endswith('$') or stripped.endswith('#'):
+                if '@' in stripped or ':' in stripped:
+                    continue
+            
+            kept.append(line)
+        
+        if not kept:
             return
-        
-        # Skip shell prompt echoes (lines ending with $ or #)
-        if stripped.endswith('$') or stripped.endswith('#'):
-            if '@' in stripped or ':' in stripped:
-                return
+        output = ''.join(kept)
         
         color = QColor(244, 135, 113) if is_error else QColor(204, 204, 204)
         self._add_text(output, color)
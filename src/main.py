@@ -70,5 +70,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed for ProcessPoolExecutor workers in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
 
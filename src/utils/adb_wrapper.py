@@ -7,13 +7,23 @@ with proper error handling and timeout management.
 
 import asyncio
 import logging
+import os
 import platform
+import shlex
+import uuid
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Callable
+from typing import Optional, Tuple, List, Dict, Callable, AsyncIterator
 import re
 
 logger = logging.getLogger(__name__)
 
+# Host-side adb server address (same override variable the adb client honours)
+ADB_SERVER_HOST = "127.0.0.1"
+ADB_SERVER_PORT = int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037"))
+
+# Matches one "[key]: [value]" line of `getprop` output
+_GETPROP_RE = re.compile(r'^\[([^\]]+)\]: \[([^\]]*)\]\r?$', re.M)
+
 
 class ADBError(Exception):
     """Base exception for ADB-related errors"""
@@ -35,6 +45,124 @@ class MultipleDevicesError(ADBError):
     pass
 
 
+class ADBShellSession:
+    """
+    Long-running `adb shell` process for a single device
+    
+    Commands are written to the shell's stdin and their output is read back
+    up to a unique end marker, so many commands share one adb process instead
+    of spawning a new one per call.
+    """
+    
+    def __init__(self, adb: "ADBWrapper", device: str):
+        """
+        Initialize shell session
+        
+        Args:
+            adb: ADB wrapper instance
+            device: Device serial number
+        """
+        self.adb = adb
+        self.device = device
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+    
+    async def _ensure_started(self):
+        """Spawn the shell process if it is not running"""
+        if self._process and self._process.returncode is None:
+            return
+        
+        if not self.adb._server_started:
+            await self.adb._start_server()
+        
+        import sys
+        if sys.platform == 'win32':
+            import subprocess
+            creationflags = subprocess.CREATE_NO_WINDOW
+        else:
+            creationflags = 0
+        
+        self._process = await asyncio.create_subprocess_exec(
+            str(self.adb.adb_path), "-s", self.device, "shell",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            creationflags=creationflags
+        )
+        logger.debug(f"Started persistent shell for {self.device}")
+    
+    async def run(self, command: str, timeout: int = 30) -> str:
+        """
+        Run a command in the persistent shell
+        
+        Each command runs in a subshell with stdin from /dev/null so it cannot
+        change the session's working directory or swallow the end marker.
+        
+        Args:
+            command: Shell command to execute
+            timeout: Command timeout in seconds
+        
+        Returns:
+            Command output (stdout only)
+        
+        Raises:
+            ADBError: If the shell process exits unexpectedly
+            asyncio.TimeoutError: If the command times out
+        """
+        async with self._lock:
+            await self._ensure_started()
+            marker = f"__ADB_DONE_{uuid.uuid4().hex}__"
+            
+            try:
+                self._process.stdin.write(
+                    f"( {command}\n) </dev/null 2>/dev/null\necho {marker}\n".encode('utf-8')
+                )
+                await self._process.stdin.drain()
+                return await asyncio.wait_for(self._read_until(marker), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Persistent shell command timed out after {timeout}s")
+                self.close()
+                raise
+            except (BrokenPipeError, ConnectionResetError) as e:
+                self.close()
+                raise ADBError(f"Shell session closed: {e}")
+            except asyncio.CancelledError:
+                # A partly read reply would otherwise prefix the next command's output
+                self.close()
+                raise
+    
+    async def _read_until(self, marker: str) -> str:
+        """Read stdout lines until the end marker is seen"""
+        lines = []
+        while True:
+            line = await self._process.stdout.readline()
+            if not line:
+                stderr = await self._process.stderr.read()
+                self.close()
+                self.adb._check_errors(stderr.decode('utf-8', errors='replace'))
+                raise ADBError("Shell session ended unexpectedly")
+            
+            text = line.decode('utf-8', errors='replace')
+            pos = text.find(marker)
+            if pos != -1:
+                lines.append(text[:pos])
+                return "".join(lines)
+            lines.append(text)
+    
+    def close(self):
+        """Terminate the shell process"""
+        if self._process is None:
+            return
+        try:
+            if self._process.stdin:
+                self._process.stdin.close()
+            if self._process.returncode is None:
+                self._process.terminate()
+        except Exception:
+            pass
+        self._process = None
+
+
 class ADBWrapper:
     """
     Asynchronous wrapper for ADB commands
@@ -51,6 +179,7 @@ class ADBWrapper:
         """
         self.adb_path = adb_path or self._find_adb()
         self._server_started = False
+        self._sessions: Dict[str, ADBShellSession] = {}
         logger.info(f"ADB wrapper initialized with binary: {self.adb_path}")
     
     def _find_adb(self) -> Path:
@@ -103,7 +232,8 @@ class ADBWrapper:
         args: List[str],
         timeout: int = 30,
         device: Optional[str] = None,
-        skip_server_check: bool = False
+        skip_server_check: bool = False,
+        input_data: Optional[bytes] = None
     ) -> Tuple[str, str, int]:
         """
         Execute an ADB command asynchronously
@@ -113,6 +243,7 @@ class ADBWrapper:
             timeout: Command timeout in seconds
             device: Device serial number (optional)
             skip_server_check: Skip ADB server startup check (internal use)
+            input_data: Bytes written to the command's stdin (optional)
         
         Returns:
             Tuple of (stdout, stderr, return_code)
@@ -140,13 +271,14 @@ class ADBWrapper:
             
             process = await asyncio.create_subprocess_exec(
                 *cmd,
+                stdin=asyncio.subprocess.PIPE if input_data is not None else None,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 creationflags=creationflags
             )
             
             stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+                process.communicate(input_data),
                 timeout=timeout
             )
             
@@ -268,6 +400,95 @@ class ADBWrapper:
         logger.info(f"Found {len(devices)} device(s)")
         return devices
     
+    async def track_devices(self) -> AsyncIterator[List[Dict[str, str]]]:
+        """
+        Stream device list changes from the adb server
+        
+        Opens a `host:track-devices` connection to the adb server, which pushes
+        the full device list once on connect and again on every change.
+        
+        Yields:
+            List of device dictionaries with 'serial' and 'state' keys
+        
+        Raises:
+            ADBError: If the server rejects the request
+            OSError: If the server cannot be reached
+            asyncio.IncompleteReadError: If the server closes the connection
+        
+        Losing the connection marks the server as not started, so the next
+        call starts it again.
+        """
+        if not self._server_started:
+            await self._start_server()
+        
+        try:
+            reader, writer = await asyncio.open_connection(ADB_SERVER_HOST, ADB_SERVER_PORT)
+        except OSError:
+            # Server may have been killed (e.g. restart_server); restart it on reconnect
+            self._server_started = False
+            raise
+        
+        try:
+            request = b"host:track-devices"
+            writer.write(b"%04x" % len(request) + request)
+            await writer.drain()
+            
+            status = await reader.readexactly(4)
+            if status != b"OKAY":
+                length = int(await reader.readexactly(4), 16)
+                message = (await reader.readexactly(length)).decode('utf-8', errors='replace')
+                raise ADBError(f"track-devices failed: {message}")
+            
+            while True:
+                length = int(await reader.readexactly(4), 16)
+                payload = (await reader.readexactly(length)).decode('utf-8', errors='replace')
+                
+                devices = []
+                for line in payload.splitlines():
+                    parts = line.split()
+                    if len(parts) >= 2:
+                        devices.append({'serial': parts[0], 'state': parts[1]})
+                yield devices
+        except (OSError, asyncio.IncompleteReadError):
+            # Lost the server mid-stream; restart it on reconnect
+            self._server_started = False
+            raise
+        finally:
+            writer.close()
+    
+    async def get_all_props(self, device: str) -> Dict[str, str]:
+        """
+        Get all system properties of a device with a single getprop call
+        
+        Args:
+            device: Device serial number
+        
+        Returns:
+            Dictionary mapping property names to values
+        """
+        output = await self.session(device).run("getprop")
+        return dict(_GETPROP_RE.findall(output))
+    
+    async def get_props(self, device: str, keys: List[str]) -> Dict[str, str]:
+        """
+        Get a few named system properties with a single round trip
+        
+        Args:
+            device: Device serial number
+            keys: Property names to read
+        
+        Returns:
+            Dictionary mapping each non-empty property to its value
+        """
+        command = "; ".join(f"getprop {key}" for key in keys)
+        output = await self.session(device).run(command)
+        values = output.split('\n')
+        return {
+            key: value.strip()
+            for key, value in zip(keys, values)
+            if value.strip()
+        }
+    
     async def get_device_info(self, device: str) -> Dict[str, str]:
         """
         Get detailed information about a device
@@ -278,9 +499,6 @@ class ADBWrapper:
         Returns:
             Dictionary with device properties
         """
-        props = {}
-        
-        # Get common properties
         prop_keys = [
             "ro.product.model",
             "ro.product.manufacturer",
@@ -289,17 +507,13 @@ class ADBWrapper:
             "ro.product.cpu.abi"
         ]
         
-        for key in prop_keys:
-            try:
-                stdout, _, _ = await self.execute(
-                    ["shell", "getprop", key],
-                    device=device
-                )
-                props[key] = stdout.strip()
-            except Exception as e:
-                logger.warning(f"Failed to get property {key}: {e}")
+        try:
+            all_props = await self.get_all_props(device)
+        except Exception as e:
+            logger.warning(f"Failed to get properties: {e}")
+            return {}
         
-        return props
+        return {key: all_props[key] for key in prop_keys if key in all_props}
     
     async def pair_wireless(self, ip: str, port: int, code: str) -> bool:
         """
@@ -421,6 +635,76 @@ class ADBWrapper:
             logger.error(f"File pull failed: {e}")
             return False
     
+    async def exec_out_stream(
+        self,
+        command: str,
+        device: str,
+        chunk_size: int = 256 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Run a device command and stream its raw stdout as it arrives
+        
+        Args:
+            command: Command to execute on the device
+            device: Device serial number
+            chunk_size: Maximum bytes per yielded chunk
+        
+        Yields:
+            Raw output chunks
+        
+        Raises:
+            ADBError: If the command exits with an error
+        """
+        if not self._server_started:
+            await self._start_server()
+        
+        import sys
+        if sys.platform == 'win32':
+            import subprocess
+            creationflags = subprocess.CREATE_NO_WINDOW
+        else:
+            creationflags = 0
+        
+        process = await asyncio.create_subprocess_exec(
+            str(self.adb_path), "-s", device, "exec-out", command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            creationflags=creationflags
+        )
+        
+        try:
+            while chunk := await process.stdout.read(chunk_size):
+                yield chunk
+            
+            returncode = await process.wait()
+            if returncode != 0:
+                stderr = (await process.stderr.read()).decode('utf-8', errors='replace')
+                self._check_errors(stderr)
+                raise ADBError(f"'{command}' failed: {stderr.strip()}")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+    
+    def pull_stream(
+        self,
+        remote_path: str,
+        device: str,
+        chunk_size: int = 256 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a file's contents from the device without staging it on disk
+        
+        Args:
+            remote_path: Remote file path on device
+            device: Device serial number
+            chunk_size: Maximum bytes per yielded chunk
+        
+        Returns:
+            Async iterator of raw file data chunks
+        """
+        return self.exec_out_stream(f"cat {shlex.quote(remote_path)}", device, chunk_size)
+    
     async def install_apk(
         self,
         apk_path: Path,
@@ -492,3 +776,65 @@ class ADBWrapper:
             device=device
         )
         return stdout
+    
+    async def exec_in(
+        self,
+        command: str,
+        data: bytes,
+        device: str,
+        timeout: int = 300
+    ) -> Optional[str]:
+        """
+        Run a device command with raw bytes piped to its stdin
+        
+        Uses `adb exec-in`, which (unlike `adb shell`) passes binary input
+        through unmodified. The raw exec service does not report the remote
+        command's exit status, so callers that need it must echo a marker
+        from the command and check the returned output.
+        
+        Args:
+            command: Command to execute on the device
+            data: Bytes to feed to the command's stdin
+            device: Device serial number
+            timeout: Command timeout in seconds
+        
+        Returns:
+            The command's stdout, or None if adb itself failed
+        """
+        stdout, stderr, returncode = await self.execute(
+            ["exec-in", command],
+            timeout=timeout,
+            device=device,
+            input_data=data
+        )
+        if returncode != 0:
+            logger.error(f"exec-in failed: {stderr.strip()}")
+            return None
+        return stdout
+    
+    def session(self, device: str) -> ADBShellSession:
+        """
+        Get the persistent shell session for a device, creating it on first use
+        
+        Args:
+            device: Device serial number
+        
+        Returns:
+            ADBShellSession for the device
+        """
+        session = self._sessions.get(device)
+        if session is None:
+            session = ADBShellSession(self, device)
+            self._sessions[device] = session
+        return session
+    
+    def close_session(self, device: str):
+        """
+        Close the persistent shell session for a device
+        
+        Args:
+            device: Device serial number
+        """
+        session = self._sessions.pop(device, None)
+        if session:
+            session.close()
@@ -9,6 +9,7 @@ This module provides a global lock to serialize async operations.
 import asyncio
 import logging
 from typing import Coroutine, Any, Optional
+from PySide6.QtCore import QProcess
 
 logger = logging.getLogger(__name__)
 
@@ -63,3 +64,77 @@ def safe_ensure_future(coro: Coroutine[Any, Any, Any]) -> Optional[asyncio.Task]
         logger.debug(f"Failed to schedule task: {e}")
         coro.close()
         return None
+
+
+def _signal_future(*signals) -> asyncio.Future:
+    """
+    Create a future resolved by the first of several Qt signals.
+    
+    The slots are connected immediately, so signals emitted synchronously
+    after this call are not missed, and disconnected once the future is done.
+    
+    Args:
+        signals: Bound signals to listen to
+        
+    Returns:
+        Future resulting in the index of the signal that fired
+    """
+    future = asyncio.get_running_loop().create_future()
+    slots = []
+    for index, signal in enumerate(signals):
+        def slot(*args, index=index):
+            if not future.done():
+                future.set_result(index)
+        signal.connect(slot)
+        slots.append((signal, slot))
+    
+    def disconnect(_):
+        for signal, slot in slots:
+            signal.disconnect(slot)
+    
+    future.add_done_callback(disconnect)
+    return future
+
+
+async def start_process(process: QProcess, timeout: float = 5.0) -> bool:
+    """
+    Start a QProcess without blocking the event loop.
+    
+    QProcess delivers output and exit through Qt signals, so unlike asyncio
+    subprocess transports it cannot hang under qasync when pipes break.
+    
+    Args:
+        process: Configured process to start
+        timeout: Maximum seconds to wait for startup
+        
+    Returns:
+        True if the process started, False otherwise
+    """
+    started = _signal_future(process.started, process.errorOccurred)
+    process.start()
+    try:
+        return await asyncio.wait_for(started, timeout) == 0
+    except asyncio.TimeoutError:
+        return False
+
+
+async def wait_for_process_exit(process: QProcess, timeout: float) -> bool:
+    """
+    Wait for a QProcess to finish without blocking the event loop.
+    
+    Args:
+        process: Process to wait for
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True if the process exited, False on timeout
+    """
+    if process.state() == QProcess.ProcessState.NotRunning:
+        return True
+    
+    finished = _signal_future(process.finished)
+    try:
+        await asyncio.wait_for(finished, timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False